@@ -3,8 +3,30 @@ from __future__ import absolute_import, division, print_function
 from functools import partial
 
 from . import converters, exceptions, filters, validators
-from ._config import get_run_validators, set_run_validators
-from ._funcs import asdict, assoc, astuple, evolve, has
+from ._columns import Table, column_store, to_columns
+from ._config import (
+    get_build_observer,
+    get_code_cache_dir,
+    get_populate_linecache,
+    get_run_validators,
+    set_build_observer,
+    set_code_cache_dir,
+    set_populate_linecache,
+    set_run_validators,
+)
+from ._funcs import (
+    asdict,
+    assoc,
+    astuple,
+    evolve,
+    from_dict,
+    has,
+    iter_json,
+    json_encoder,
+    sort_instances,
+    sort_key,
+    tuple_getter,
+)
 from ._make import (
     NOTHING,
     Attribute,
@@ -44,6 +66,7 @@ __all__ = [
     "Attribute",
     "Factory",
     "NOTHING",
+    "Table",
     "asdict",
     "assoc",
     "astuple",
@@ -51,18 +74,32 @@ __all__ = [
     "attrib",
     "attributes",
     "attrs",
+    "column_store",
     "converters",
     "evolve",
     "exceptions",
     "fields",
     "fields_dict",
     "filters",
+    "from_dict",
+    "get_build_observer",
+    "get_code_cache_dir",
+    "get_populate_linecache",
     "get_run_validators",
     "has",
     "ib",
+    "iter_json",
+    "json_encoder",
     "make_class",
     "s",
+    "set_build_observer",
+    "set_code_cache_dir",
+    "set_populate_linecache",
     "set_run_validators",
+    "sort_instances",
+    "sort_key",
+    "to_columns",
+    "tuple_getter",
     "validate",
     "validators",
 ]
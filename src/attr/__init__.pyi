@@ -3,6 +3,8 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -187,6 +189,9 @@ def attrs(
     auto_exc: bool = ...,
     eq: Optional[bool] = ...,
     order: Optional[bool] = ...,
+    lazy: bool = ...,
+    eager_hash: bool = ...,
+    intern: bool = ...,
 ) -> _C: ...
 @overload
 def attrs(
@@ -207,6 +212,9 @@ def attrs(
     auto_exc: bool = ...,
     eq: Optional[bool] = ...,
     order: Optional[bool] = ...,
+    lazy: bool = ...,
+    eager_hash: bool = ...,
+    intern: bool = ...,
 ) -> Callable[[_C], _C]: ...
 
 # TODO: add support for returning NamedTuple from the mypy plugin
@@ -238,6 +246,9 @@ def make_class(
     auto_exc: bool = ...,
     eq: Optional[bool] = ...,
     order: Optional[bool] = ...,
+    lazy: bool = ...,
+    eager_hash: bool = ...,
+    intern: bool = ...,
 ) -> type: ...
 
 # _funcs --
@@ -252,6 +263,7 @@ def asdict(
     filter: Optional[_FilterType[Any]] = ...,
     dict_factory: Type[Mapping[Any, Any]] = ...,
     retain_collection_types: bool = ...,
+    memo: bool = ...,
 ) -> Dict[str, Any]: ...
 
 # TODO: add support for returning NamedTuple from the mypy plugin
@@ -261,15 +273,65 @@ def astuple(
     filter: Optional[_FilterType[Any]] = ...,
     tuple_factory: Type[Sequence[Any]] = ...,
     retain_collection_types: bool = ...,
+    memo: bool = ...,
 ) -> Tuple[Any, ...]: ...
 def has(cls: type) -> bool: ...
 def assoc(inst: _T, **changes: Any) -> _T: ...
 def evolve(inst: _T, **changes: Any) -> _T: ...
+def sort_key(cls: type) -> Callable[[Any], Any]: ...
+def sort_instances(
+    instances: Iterable[_T], reverse: bool = ...
+) -> List[_T]: ...
+def tuple_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]: ...
+def iter_json(
+    obj: Any,
+    filter: Optional[_FilterType[Any]] = ...,
+    default: Optional[Callable[[Any], Any]] = ...,
+) -> Iterator[str]: ...
+def json_encoder(
+    cls: Type[_T], filter: Optional[_FilterType[Any]] = ...
+) -> Callable[[_T], str]: ...
+def from_dict(cls: Type[_T], data: Mapping[str, Any]) -> _T: ...
+
+# _columns --
+
+class Table(Generic[_T]):
+    def __init__(
+        self, cls: Type[_T], instances: Iterable[_T] = ...
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Any: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    @property
+    def cls(self) -> Type[_T]: ...
+    @property
+    def columns(self) -> Dict[str, Sequence[Any]]: ...
+    def append(self, instance: _T) -> None: ...
+    def extend(self, instances: Iterable[_T]) -> None: ...
+    def instance(self, index: int) -> _T: ...
+    def instances(self) -> Iterator[_T]: ...
+
+def column_store(
+    cls: Type[_T], instances: Iterable[_T] = ...
+) -> Table[_T]: ...
+def to_columns(
+    instances: Iterable[Any], cls: type
+) -> Dict[str, List[Any]]: ...
 
 # _config --
 
 def set_run_validators(run: bool) -> None: ...
 def get_run_validators() -> bool: ...
+def set_populate_linecache(populate: bool) -> None: ...
+def get_populate_linecache() -> bool: ...
+def set_code_cache_dir(path: Optional[str]) -> None: ...
+def get_code_cache_dir() -> Optional[str]: ...
+def set_build_observer(
+    observer: Optional[Callable[[type, List[Tuple[str, float]]], Any]]
+) -> None: ...
+def get_build_observer() -> Optional[
+    Callable[[type, List[Tuple[str, float]]], Any]
+]: ...
 
 # aliases --
 
@@ -0,0 +1,303 @@
+from __future__ import absolute_import, division, print_function
+
+import operator
+
+from array import array
+
+from ._compat import PY2, iteritems, ordered_dict
+from ._funcs import _cache_on
+from ._make import _generate_unique_filename, _make_method, fields
+
+
+if PY2:
+    from itertools import izip as zip
+
+
+try:
+    array("q")
+    _int_typecode = "q"
+except ValueError:  # Python 2 has no long long arrays.
+    _int_typecode = "l"
+
+
+def _empty_column(type_):
+    """
+    Return an empty column for the values of an attribute of *type_*.
+
+    Only `int` and `float` values can be stored unboxed.  *type_* may be
+    anything, including unhashable objects.
+    """
+    if type_ is int:
+        return array(_int_typecode)
+    if type_ is float:
+        return array("d")
+    return []
+
+
+class Table(object):
+    """
+    A collection of instances of an ``attrs`` class that stores the values of
+    each attribute in one column instead of keeping the instances around.
+
+    Use `attr.column_store` to create one.
+
+    Columns of attributes whose *type* is `int` or `float` are arrays of
+    machine values (see `array`) as long as all of their values are exactly
+    of that type and fit into 64 bits.  All other columns are lists.
+    Therefore many small instances take up a fraction of the memory.
+
+    Indexing returns a lightweight read-only view of a row whose attributes
+    are the values of the attributes of the stored instance.  Use
+    `instance` to get a real instance back.
+
+    .. versionadded:: 20.1.0
+    """
+
+    __slots__ = ("_cls", "_fields", "_init_names", "_columns", "_length")
+
+    def __init__(self, cls, instances=()):
+        attrs = fields(cls)
+        self._cls = cls
+        self._fields = attrs
+        self._init_names = tuple(
+            (a.name, a.name.lstrip("_")) for a in attrs if a.init
+        )
+        self._columns = ordered_dict(
+            (a.name, _empty_column(a.type)) for a in attrs
+        )
+        self._length = 0
+        self.extend(instances)
+
+    def __repr__(self):
+        return "<Table(cls={cls}, rows={rows})>".format(
+            cls=self._cls.__name__, rows=self._length
+        )
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        return _Row(self, self._check_index(index))
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield _Row(self, index)
+
+    @property
+    def cls(self):
+        """
+        The class of the stored instances.
+        """
+        return self._cls
+
+    @property
+    def columns(self):
+        """
+        A dict of attribute names to their columns.
+
+        The columns are the ones the table uses and must not be modified.
+        """
+        return ordered_dict(iteritems(self._columns))
+
+    def append(self, instance):
+        """
+        Store the attribute values of *instance*.
+
+        :raise TypeError: If *instance* is not an instance of exactly the
+            class of the table.
+        """
+        if instance.__class__ is not self._cls:
+            raise TypeError(
+                "Can only store instances of {0}, got {1}.".format(
+                    self._cls.__name__, instance.__class__.__name__
+                )
+            )
+
+        # Get all values first, so a missing one doesn't leave the columns
+        # with different lengths behind.
+        values = [getattr(instance, a.name) for a in self._fields]
+        columns = self._columns
+        for a, value in zip(self._fields, values):
+            column = columns[a.name]
+            if column.__class__ is array:
+                if value.__class__ is a.type:
+                    try:
+                        column.append(value)
+                        continue
+                    except OverflowError:
+                        pass
+                column = columns[a.name] = list(column)
+            column.append(value)
+
+        self._length += 1
+
+    def extend(self, instances):
+        """
+        Store the attribute values of all *instances* using `append`.
+        """
+        for instance in instances:
+            self.append(instance)
+
+    def instance(self, index):
+        """
+        Return a new instance with the values stored at *index*.
+
+        The instance is created by calling the class with the stored values
+        of all attributes that are initialized by ``__init__``, just like
+        `attr.evolve` does.
+        """
+        index = self._check_index(index)
+        columns = self._columns
+
+        return self._cls(
+            **dict(
+                (init_name, columns[name][index])
+                for name, init_name in self._init_names
+            )
+        )
+
+    def instances(self):
+        """
+        Return an iterator of new instances of all rows, using `instance`.
+        """
+        for index in range(self._length):
+            yield self.instance(index)
+
+    def _check_index(self, index):
+        """
+        Return *index* as a non-negative integer.
+        """
+        index = operator.index(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Table index out of range.")
+
+        return index
+
+
+class _Row(object):
+    """
+    A read-only view of one row of a `Table`.
+    """
+
+    # The names are prefixed to avoid clashes with attribute names.
+    __slots__ = ("_attrs_table", "_attrs_index")
+
+    def __init__(self, table, index):
+        self._attrs_table = table
+        self._attrs_index = index
+
+    def __getattr__(self, name):
+        # Our own slots end up here if they're not set.
+        if name in _Row.__slots__:
+            raise AttributeError(name)
+
+        try:
+            column = self._attrs_table._columns[name]
+        except KeyError:
+            raise AttributeError(
+                "{0!r} row has no attribute {1!r}".format(
+                    self._attrs_table._cls.__name__, name
+                )
+            )
+
+        return column[self._attrs_index]
+
+    def __repr__(self):
+        table = self._attrs_table
+        return "<{cls} row {index}: {values}>".format(
+            cls=table._cls.__name__,
+            index=self._attrs_index,
+            values=", ".join(
+                "{0}={1!r}".format(name, column[self._attrs_index])
+                for name, column in iteritems(table._columns)
+            ),
+        )
+
+
+def column_store(cls, instances=()):
+    """
+    Return a `attr.Table` that stores *instances* of *cls* column by column.
+
+    :param type cls: Class with ``attrs`` attributes.
+    :param instances: Instances of *cls* to store.
+    :type instances: iterable
+
+    :rtype: attr.Table
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If *instances* aren't instances of exactly *cls*.
+
+    .. versionadded:: 20.1.0
+    """
+    return Table(cls, instances)
+
+
+def to_columns(instances, cls):
+    """
+    Return the attribute values of *instances* of *cls* as a dict of
+    attribute names to lists of values.
+
+    It's like calling `attr.asdict` without recursion on every instance and
+    collecting the values by attribute, but a lot faster because a loop that
+    extracts all attributes at once is generated for each class.  The values
+    are not copied or converted.
+
+    :param instances: Instances of *cls*.
+    :type instances: iterable
+    :param type cls: Class with ``attrs`` attributes.
+
+    :rtype: dict
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    .. versionadded:: 20.1.0
+    """
+    cache = getattr(cls, "__attrs_to_columns__", None)
+    extract = cache.get(cls) if cache is not None else None
+    if extract is None:
+        extract = _make_extractor(cls)
+
+    return ordered_dict(extract(instances))
+
+
+def _make_extractor(cls):
+    """
+    Return a function that returns ``(name, column)`` pairs for all
+    attributes of the instances of *cls* it is called with, and cache it on
+    *cls*.
+    """
+    names = [a.name for a in fields(cls)]
+    lines = ["def to_columns(instances):"]
+    for i in range(len(names)):
+        lines.append("    _{0} = []".format(i))
+        lines.append("    _append_{0} = _{0}.append".format(i))
+    lines.append("    for inst in instances:")
+    lines.extend(
+        "        _append_{0}(inst.{1})".format(i, name)
+        for i, name in enumerate(names)
+    )
+    if names:
+        lines.append(
+            "    return ({0},)".format(
+                ", ".join(
+                    "({0!r}, _{1})".format(name, i)
+                    for i, name in enumerate(names)
+                )
+            )
+        )
+    else:
+        lines.append("        pass")
+        lines.append("    return ()")
+
+    extract = _make_method(
+        "to_columns",
+        "\n".join(lines) + "\n",
+        _generate_unique_filename(cls, "to_columns"),
+    )
+    _cache_on(cls, "__attrs_to_columns__", cls, extract)
+
+    return extract
@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, print_function
 
 import platform
 import sys
+import time
 import types
 import warnings
 
@@ -10,6 +11,15 @@ PY2 = sys.version_info[0] == 2
 PYPY = platform.python_implementation() == "PyPy"
 
 
+# time.perf_counter() is Python 3-only.
+perf_counter = getattr(time, "perf_counter", time.time)
+
+try:
+    RecursionError = RecursionError
+except NameError:  # Python 2 raises a plain RuntimeError instead.
+    RecursionError = RuntimeError
+
+
 if PYPY or sys.version_info[:2] >= (3, 6):
     ordered_dict = dict
 else:
@@ -20,7 +30,7 @@ else:
 
 if PY2:
     from UserDict import IterableUserDict
-    from collections import Mapping, Sequence
+    from collections import Iterator, Mapping, Sequence
 
     # We 'bundle' isclass instead of using inspect as importing inspect is
     # fairly expensive (order of 10-15 ms for a modern machine in 2016)
@@ -98,7 +108,7 @@ if PY2:
 
 
 else:  # Python 3 and later.
-    from collections.abc import Mapping, Sequence  # noqa
+    from collections.abc import Iterator, Mapping, Sequence  # noqa
 
     def just_warn(*args, **kw):
         """
@@ -1,9 +1,21 @@
 from __future__ import absolute_import, division, print_function
 
 
-__all__ = ["set_run_validators", "get_run_validators"]
+__all__ = [
+    "set_run_validators",
+    "get_run_validators",
+    "set_code_cache_dir",
+    "get_code_cache_dir",
+    "set_build_observer",
+    "get_build_observer",
+    "set_populate_linecache",
+    "get_populate_linecache",
+]
 
 _run_validators = True
+_code_cache_dir = None
+_build_observer = None
+_populate_linecache = True
 
 
 def set_run_validators(run):
@@ -21,3 +33,87 @@ def get_run_validators():
     Return whether or not validators are run.
     """
     return _run_validators
+
+
+def set_code_cache_dir(path):
+    """
+    Set the directory in which the byte code of generated methods is cached
+    across interpreter runs.  Pass ``None`` to disable the cache, which is
+    the default.
+
+    The directory is created on first write if it doesn't exist yet.
+
+    .. versionadded:: 20.1.0
+    """
+    if path is not None and not isinstance(path, (str, type(u""))):
+        raise TypeError("'path' must be a str or None.")
+    global _code_cache_dir
+    _code_cache_dir = path
+
+
+def get_code_cache_dir():
+    """
+    Return the directory used for caching the byte code of generated methods
+    or ``None`` if caching is disabled.
+
+    .. versionadded:: 20.1.0
+    """
+    return _code_cache_dir
+
+
+def set_build_observer(observer):
+    """
+    Set a callable that is called with each class that ``attrs`` builds and
+    how long the steps of building it took.  Pass ``None`` to stop observing,
+    which is the default.
+
+    *observer* is called as ``observer(cls, timings)`` where *timings* is a
+    list of ``(step, seconds)`` tuples in the order the steps have started.
+    The steps are ``"transform_attrs"``, the ``add_*`` steps (e.g.
+    ``"add_init"``), and either ``"create_slots_class"`` or
+    ``"patch_original_class"``.  Each ``"compile"`` step is part of the
+    ``add_*`` step before it.  Methods of classes with ``lazy=True`` are
+    generated outside of the build and are not part of its timings.
+
+    .. versionadded:: 20.1.0
+    """
+    if observer is not None and not callable(observer):
+        raise TypeError("'observer' must be callable or None.")
+    global _build_observer
+    _build_observer = observer
+
+
+def get_build_observer():
+    """
+    Return the build observer or ``None`` if there is none.
+
+    .. versionadded:: 20.1.0
+    """
+    return _build_observer
+
+
+def set_populate_linecache(populate):
+    """
+    Set whether or not the source code of generated methods is added to
+    `linecache`.  By default, it is.
+
+    Debuggers and tracebacks need it to show the source of generated
+    methods.  If you don't need that in production, turning it off saves
+    the memory of the sources.
+
+    .. versionadded:: 20.1.0
+    """
+    if not isinstance(populate, bool):
+        raise TypeError("'populate' must be bool.")
+    global _populate_linecache
+    _populate_linecache = populate
+
+
+def get_populate_linecache():
+    """
+    Return whether or not the source code of generated methods is added to
+    `linecache`.
+
+    .. versionadded:: 20.1.0
+    """
+    return _populate_linecache
@@ -1,9 +1,31 @@
 from __future__ import absolute_import, division, print_function
 
 import copy
+import numbers
+import sys
 
-from ._compat import iteritems
-from ._make import NOTHING, _obj_setattr, fields
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+
+from ._compat import (
+    PY2,
+    Iterator,
+    Mapping,
+    RecursionError,
+    Sequence,
+    isclass,
+    iteritems,
+)
+from ._make import (
+    NOTHING,
+    Factory,
+    _generate_unique_filename,
+    _make_method,
+    _non_recursive_types,
+    _obj_setattr,
+    _ordered_by,
+    fields,
+)
 from .exceptions import AttrsAttributeNotFoundError
 
 
@@ -13,6 +35,7 @@ def asdict(
     filter=None,
     dict_factory=dict,
     retain_collection_types=False,
+    memo=False,
 ):
     """
     Return the ``attrs`` attribute values of *inst* as a dict.
@@ -32,6 +55,11 @@ def asdict(
     :param bool retain_collection_types: Do not convert to ``list`` when
         encountering an attribute whose type is ``tuple`` or ``set``.  Only
         meaningful if ``recurse`` is ``True``.
+    :param bool memo: Convert instances and collections that occur more than
+        once only once and put the same result everywhere, which saves time
+        and memory for shared objects.  Raise a `ValueError` on circular
+        references instead of `RecursionError`.  Only meaningful if
+        ``recurse`` is ``True``.
 
     :rtype: return type of *dict_factory*
 
@@ -40,7 +68,53 @@ def asdict(
 
     ..  versionadded:: 16.0.0 *dict_factory*
     ..  versionadded:: 16.1.0 *retain_collection_types*
+    ..  versionchanged:: 20.1.0
+       Without a *filter*, a function specialized for the class is generated
+       and cached, which makes this several times faster.
+    ..  versionchanged:: 20.1.0
+       Instances and collections nested deeper than the recursion limit
+       don't raise `RecursionError` anymore.
+    ..  versionadded:: 20.1.0 *memo*
+    """
+    if memo is True and recurse is True:
+        fields(inst.__class__)
+        return _run_steps(
+            _asdict_steps(
+                inst, filter, dict_factory, retain_collection_types, {}
+            )
+        )
+
+    try:
+        return _asdict(
+            inst, recurse, filter, dict_factory, retain_collection_types
+        )
+    except RecursionError:
+        if recurse is not True or not _recursed_too_deep(sys.exc_info()[2]):
+            raise
+
+    # Too deep to recurse, but an explicit stack always works.
+    return _run_steps(
+        _asdict_steps(
+            inst, filter, dict_factory, retain_collection_types, active=set(),
+        )
+    )
+
+
+def _asdict(inst, recurse, filter, dict_factory, retain_collection_types):
     """
+    Convert *inst* like ``asdict`` without *memo*, by recursing.
+    """
+    if filter is None:
+        cls = inst.__class__
+        key = (cls, recurse is True, dict_factory is dict)
+        # The cache may be inherited, hence the class in the key.
+        cache = getattr(cls, "__attrs_asdict__", None)
+        f = cache.get(key) if cache is not None else None
+        if f is None:
+            f = _make_asdict(*key)
+
+        return f(inst, dict_factory, retain_collection_types)
+
     attrs = fields(inst.__class__)
     rv = dict_factory()
     for a in attrs:
@@ -49,7 +123,7 @@ def asdict(
             continue
         if recurse is True:
             if has(v.__class__):
-                rv[a.name] = asdict(
+                rv[a.name] = _asdict(
                     v, True, filter, dict_factory, retain_collection_types
                 )
             elif isinstance(v, (tuple, list, set)):
@@ -82,13 +156,77 @@ def asdict(
     return rv
 
 
+_asdict_value_tmpl = """\
+    _{i} = inst.{name}
+    if _{i}.__class__ not in _non_recursive_types:
+        _{i} = _asdict_anything(
+            _{i}, None, dict_factory, retain_collection_types
+        )"""
+
+
+def _make_asdict(cls, recurse, is_dict):
+    """
+    Return an ``asdict`` for instances of *cls* that works like calling
+    ``asdict`` without a filter and cache it on *cls*.
+
+    Values of scalar types are used as they are; all others go through
+    `_asdict_anything` if *recurse* is True.  If *is_dict* is True, the
+    function creates a ``dict`` instead of calling ``dict_factory``.
+    """
+    names = [a.name for a in fields(cls)]
+    lines = ["def asdict(inst, dict_factory, retain_collection_types):"]
+    if recurse:
+        lines.extend(
+            _asdict_value_tmpl.format(i=i, name=name)
+            for i, name in enumerate(names)
+        )
+        values = ["_{0}".format(i) for i in range(len(names))]
+    else:
+        values = ["inst." + name for name in names]
+
+    if is_dict:
+        lines.append(
+            "    return {{{0}}}".format(
+                ", ".join(
+                    "{0!r}: {1}".format(name, value)
+                    for name, value in zip(names, values)
+                )
+            )
+        )
+    else:
+        # Fill the result like the generic loop does, since dict_factory
+        # may not take arguments.
+        lines.append("    rv = dict_factory()")
+        lines.extend(
+            "    rv[{0!r}] = {1}".format(name, value)
+            for name, value in zip(names, values)
+        )
+        lines.append("    return rv")
+
+    f = _make_method(
+        "asdict",
+        "\n".join(lines) + "\n",
+        _generate_unique_filename(cls, "asdict"),
+        {
+            "_asdict_anything": _asdict_anything,
+            "_non_recursive_types": _non_recursive_types,
+        },
+    )
+
+    _cache_on(cls, "__attrs_asdict__", (cls, recurse, is_dict), f)
+
+    return f
+
+
 def _asdict_anything(val, filter, dict_factory, retain_collection_types):
     """
     ``asdict`` only works on attrs instances, this works on anything.
     """
-    if getattr(val.__class__, "__attrs_attrs__", None) is not None:
+    if val.__class__ in _non_recursive_types:
+        rv = val
+    elif getattr(val.__class__, "__attrs_attrs__", None) is not None:
         # Attrs class.
-        rv = asdict(val, True, filter, dict_factory, retain_collection_types)
+        rv = _asdict(val, True, filter, dict_factory, retain_collection_types)
     elif isinstance(val, (tuple, list, set)):
         cf = val.__class__ if retain_collection_types is True else list
         rv = cf(
@@ -113,12 +251,146 @@ def _asdict_anything(val, filter, dict_factory, retain_collection_types):
     return rv
 
 
+def _asdict_is_nested(val):
+    """
+    Return whether `_asdict_anything` would convert *val* by recursing.
+    """
+    cls = val.__class__
+    return cls not in _non_recursive_types and (
+        getattr(cls, "__attrs_attrs__", None) is not None
+        or isinstance(val, (tuple, list, set, dict))
+    )
+
+
+def _asdict_steps(
+    val, filter, dict_factory, retain_collection_types, memo=None, active=None
+):
+    """
+    Convert *val* like `_asdict_anything` without recursing, for
+    `_run_steps`.
+
+    *val* must be nested according to `_asdict_is_nested`.  If *memo* is a
+    dict, results are looked up and stored in it.  Otherwise, if *active* is
+    a set, the ids of the objects that are being converted are kept in it
+    to detect circular references.
+    """
+    cls = val.__class__
+    key = id(val)
+    if memo is not None:
+        rv = memo.get(key, NOTHING)
+        if rv is _IN_PROGRESS:
+            raise _circular(cls)
+        if rv is not NOTHING:
+            yield False, rv
+            return
+        memo[key] = _IN_PROGRESS
+    elif active is not None:
+        if key in active:
+            raise _circular(cls, RecursionError)
+        active.add(key)
+
+    args = (filter, dict_factory, retain_collection_types, memo, active)
+    if getattr(cls, "__attrs_attrs__", None) is not None:
+        rv = dict_factory()
+        for a in fields(cls):
+            v = getattr(val, a.name)
+            if filter is not None and not filter(a, v):
+                continue
+            if _asdict_is_nested(v):
+                v = yield True, _asdict_steps(v, *args)
+            rv[a.name] = v
+    elif isinstance(val, (tuple, list, set)):
+        items = []
+        for i in val:
+            if _asdict_is_nested(i):
+                i = yield True, _asdict_steps(i, *args)
+            items.append(i)
+        rv = (cls if retain_collection_types is True else list)(items)
+    else:
+        items = []
+        for kk, vv in iteritems(val):
+            if _asdict_is_nested(kk):
+                kk = yield True, _asdict_steps(kk, *args)
+            if _asdict_is_nested(vv):
+                vv = yield True, _asdict_steps(vv, *args)
+            items.append((kk, vv))
+        rv = dict_factory(items)
+
+    if memo is not None:
+        memo[key] = rv
+    elif active is not None:
+        active.discard(key)
+    yield False, rv
+
+
+# Marks the results of conversions that haven't finished yet in memos.
+_IN_PROGRESS = object()
+
+
+def _circular(cls, error=ValueError):
+    """
+    Return the *error* for an instance of *cls* that contains itself.
+    """
+    return error(
+        "Circular reference to a {0} instance detected.".format(cls.__name__)
+    )
+
+
+def _recursed_too_deep(tb):
+    """
+    Return whether the `RecursionError` with the traceback *tb* has been
+    raised because ``asdict``, ``astuple``, or a `json_encoder` recursed into
+    a structure that is nested too deeply -- and not by a filter, a property,
+    or other code.
+
+    That's the case if the conversion itself used up most of the stack.
+    """
+    ours = total = 0
+    while tb is not None:
+        filename = tb.tb_frame.f_code.co_filename
+        if filename == _own_filename or filename.startswith(
+            "<attrs generated "
+        ):
+            ours += 1
+        total += 1
+        tb = tb.tb_next
+
+    return total * 2 >= sys.getrecursionlimit() and ours * 2 >= total
+
+
+# The file name of the code in this module, see `_recursed_too_deep`.
+_own_filename = _recursed_too_deep.__code__.co_filename
+
+
+def _run_steps(steps):
+    """
+    Run the generator *steps* and return its result.
+
+    Step generators yield ``(True, other_steps)`` to have the result of
+    *other_steps* sent back and ``(False, result)`` once they're done.  The
+    pending generators are kept in a list, so the depth of a structure isn't
+    limited by the recursion limit.
+    """
+    stack = [steps]
+    value = None
+    while True:
+        is_call, value = stack[-1].send(value)
+        if is_call:
+            stack.append(value)
+            value = None
+        else:
+            stack.pop()
+            if not stack:
+                return value
+
+
 def astuple(
     inst,
     recurse=True,
     filter=None,
     tuple_factory=tuple,
     retain_collection_types=False,
+    memo=False,
 ):
     """
     Return the ``attrs`` attribute values of *inst* as a tuple.
@@ -138,6 +410,11 @@ def astuple(
         or ``dict`` when encountering an attribute which type is
         ``tuple``, ``dict`` or ``set``.  Only meaningful if ``recurse`` is
         ``True``.
+    :param bool memo: Convert instances that occur more than once only once
+        and put the same result everywhere, which saves time and memory for
+        shared instances.  Raise a `ValueError` on circular references
+        instead of `RecursionError`.  Only meaningful if ``recurse`` is
+        ``True``.
 
     :rtype: return type of *tuple_factory*
 
@@ -145,73 +422,850 @@ def astuple(
         class.
 
     ..  versionadded:: 16.2.0
+    ..  versionchanged:: 20.1.0
+       Without a *filter*, a function specialized for the class is generated
+       and cached, which makes this several times faster.
+    ..  versionchanged:: 20.1.0
+       Instances nested deeper than the recursion limit don't raise
+       `RecursionError` anymore.
+    ..  versionadded:: 20.1.0 *memo*
+    """
+    if memo is True and recurse is True:
+        fields(inst.__class__)
+        return _run_steps(
+            _astuple_steps(
+                inst, filter, tuple_factory, retain_collection_types, {}
+            )
+        )
+
+    try:
+        return _astuple(
+            inst, recurse, filter, tuple_factory, retain_collection_types
+        )
+    except RecursionError:
+        if recurse is not True or not _recursed_too_deep(sys.exc_info()[2]):
+            raise
+
+    # Too deep to recurse, but an explicit stack always works.
+    return _run_steps(
+        _astuple_steps(
+            inst, filter, tuple_factory, retain_collection_types, active=set(),
+        )
+    )
+
+
+def _astuple(inst, recurse, filter, tuple_factory, retain_collection_types):
+    """
+    Convert *inst* like ``astuple`` without *memo*, by recursing.
     """
+    if filter is None:
+        cls = inst.__class__
+        if recurse is not True and tuple_factory is tuple:
+            return tuple_getter(cls)(inst)
+
+        if tuple_factory is tuple:
+            kind = "tuple"
+        elif tuple_factory is list:
+            kind = "list"
+        else:
+            kind = None
+        key = (cls, recurse is True, kind)
+        # The cache may be inherited, hence the class in the key.
+        cache = getattr(cls, "__attrs_astuple__", None)
+        f = cache.get(key) if cache is not None else None
+        if f is None:
+            f = _make_astuple(*key)
+
+        return f(inst, tuple_factory, retain_collection_types)
+
     attrs = fields(inst.__class__)
     rv = []
-    retain = retain_collection_types  # Very long. :/
     for a in attrs:
         v = getattr(inst, a.name)
         if filter is not None and not filter(a, v):
             continue
         if recurse is True:
-            if has(v.__class__):
-                rv.append(
-                    astuple(
-                        v,
-                        recurse=True,
-                        filter=filter,
-                        tuple_factory=tuple_factory,
-                        retain_collection_types=retain,
-                    )
-                )
-            elif isinstance(v, (tuple, list, set)):
-                cf = v.__class__ if retain is True else list
-                rv.append(
-                    cf(
-                        [
-                            astuple(
-                                j,
-                                recurse=True,
-                                filter=filter,
-                                tuple_factory=tuple_factory,
-                                retain_collection_types=retain,
-                            )
-                            if has(j.__class__)
-                            else j
-                            for j in v
-                        ]
-                    )
+            rv.append(
+                _astuple_value(
+                    v, filter, tuple_factory, retain_collection_types
                 )
-            elif isinstance(v, dict):
-                df = v.__class__ if retain is True else dict
-                rv.append(
-                    df(
-                        (
-                            astuple(
-                                kk,
-                                tuple_factory=tuple_factory,
-                                retain_collection_types=retain,
-                            )
-                            if has(kk.__class__)
-                            else kk,
-                            astuple(
-                                vv,
-                                tuple_factory=tuple_factory,
-                                retain_collection_types=retain,
-                            )
-                            if has(vv.__class__)
-                            else vv,
-                        )
-                        for kk, vv in iteritems(v)
-                    )
-                )
-            else:
-                rv.append(v)
+            )
         else:
             rv.append(v)
     return rv if tuple_factory is list else tuple_factory(rv)
 
 
+def _astuple_value(v, filter, tuple_factory, retain):
+    """
+    Return what ``astuple`` puts into the result for the attribute value *v*
+    if it recurses.
+    """
+    if has(v.__class__):
+        return _astuple(v, True, filter, tuple_factory, retain)
+    elif isinstance(v, (tuple, list, set)):
+        cf = v.__class__ if retain is True else list
+        return cf(
+            [
+                _astuple(j, True, filter, tuple_factory, retain)
+                if has(j.__class__)
+                else j
+                for j in v
+            ]
+        )
+    elif isinstance(v, dict):
+        df = v.__class__ if retain is True else dict
+        return df(
+            (
+                _astuple(kk, True, None, tuple_factory, retain)
+                if has(kk.__class__)
+                else kk,
+                _astuple(vv, True, None, tuple_factory, retain)
+                if has(vv.__class__)
+                else vv,
+            )
+            for kk, vv in iteritems(v)
+        )
+    else:
+        return v
+
+
+def _astuple_steps(
+    inst, filter, tuple_factory, retain, memo=None, active=None
+):
+    """
+    Convert the attrs instance *inst* like ``astuple`` without recursing, for
+    `_run_steps`.
+
+    If *memo* is a dict, results are looked up and stored in it.  Otherwise,
+    if *active* is a set, the ids of the instances that are being converted
+    are kept in it to detect circular references.
+    """
+    if memo is not None:
+        # Dict keys and values are converted without the filter.
+        key = (id(inst), filter is None)
+        rv = memo.get(key, NOTHING)
+        if rv is _IN_PROGRESS:
+            raise _circular(inst.__class__)
+        if rv is not NOTHING:
+            yield False, rv
+            return
+        memo[key] = _IN_PROGRESS
+    elif active is not None:
+        key = id(inst)
+        if key in active:
+            raise _circular(inst.__class__, RecursionError)
+        active.add(key)
+
+    rv = []
+    for a in fields(inst.__class__):
+        v = getattr(inst, a.name)
+        if filter is not None and not filter(a, v):
+            continue
+        cls = v.__class__
+        if has(cls):
+            v = (
+                yield True,
+                _astuple_steps(v, filter, tuple_factory, retain, memo, active),
+            )
+        elif isinstance(v, (tuple, list, set)):
+            items = []
+            for j in v:
+                if has(j.__class__):
+                    j = (
+                        yield True,
+                        _astuple_steps(
+                            j, filter, tuple_factory, retain, memo, active
+                        ),
+                    )
+                items.append(j)
+            v = (cls if retain is True else list)(items)
+        elif isinstance(v, dict):
+            items = []
+            for kk, vv in iteritems(v):
+                if has(kk.__class__):
+                    kk = (
+                        yield True,
+                        _astuple_steps(
+                            kk, None, tuple_factory, retain, memo, active
+                        ),
+                    )
+                if has(vv.__class__):
+                    vv = (
+                        yield True,
+                        _astuple_steps(
+                            vv, None, tuple_factory, retain, memo, active
+                        ),
+                    )
+                items.append((kk, vv))
+            v = (cls if retain is True else dict)(items)
+        rv.append(v)
+
+    rv = rv if tuple_factory is list else tuple_factory(rv)
+    if memo is not None:
+        memo[key] = rv
+    elif active is not None:
+        active.discard(key)
+    yield False, rv
+
+
+_astuple_value_tmpl = """\
+    _{i} = inst.{name}
+    if _{i}.__class__ not in _non_recursive_types:
+        _{i} = _astuple_value(
+            _{i}, None, tuple_factory, retain_collection_types
+        )"""
+
+
+def _make_astuple(cls, recurse, kind):
+    """
+    Return an ``astuple`` for instances of *cls* that works like calling
+    ``astuple`` without a filter and cache it on *cls*.
+
+    Values of scalar types are used as they are; all others go through
+    `_astuple_value` if *recurse* is True.  If *kind* is ``"tuple"`` or
+    ``"list"``, the function creates one of those instead of calling
+    ``tuple_factory``.
+    """
+    names = [a.name for a in fields(cls)]
+    lines = ["def astuple(inst, tuple_factory, retain_collection_types):"]
+    if recurse:
+        lines.extend(
+            _astuple_value_tmpl.format(i=i, name=name)
+            for i, name in enumerate(names)
+        )
+        values = ["_{0}".format(i) for i in range(len(names))]
+    else:
+        values = ["inst." + name for name in names]
+
+    if kind == "tuple":
+        lines.append(
+            "    return ({0})".format(
+                "".join(value + ", " for value in values).rstrip()
+            )
+        )
+    else:
+        values = "[{0}]".format(", ".join(values))
+        if kind == "list":
+            lines.append("    return " + values)
+        else:
+            lines.append("    return tuple_factory({0})".format(values))
+
+    f = _make_method(
+        "astuple",
+        "\n".join(lines) + "\n",
+        _generate_unique_filename(cls, "astuple"),
+        {
+            "_astuple_value": _astuple_value,
+            "_non_recursive_types": _non_recursive_types,
+        },
+    )
+    _cache_on(cls, "__attrs_astuple__", (cls, recurse, kind), f)
+
+    return f
+
+
+def tuple_getter(cls):
+    """
+    Return a function that returns the ``attrs`` attribute values of an
+    instance of *cls* as a tuple.
+
+    It returns the same as ``attr.astuple(inst, recurse=False)`` but is
+    implemented in C if *cls* has more than one attribute, which makes it
+    ideal for exporting rows, e.g. for
+    ``cursor.executemany(sql, map(attr.tuple_getter(C), instances))``.
+
+    :param type cls: Class with ``attrs`` attributes.
+
+    :rtype: callable
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    .. versionadded:: 20.1.0
+    """
+    key = (cls, "getter")
+    cache = getattr(cls, "__attrs_astuple__", None)
+    getter = cache.get(key) if cache is not None else None
+    if getter is not None:
+        return getter
+
+    names = [a.name for a in fields(cls)]
+    if len(names) > 1:
+        getter = attrgetter(*names)
+    else:
+        # attrgetter returns the bare value for a single name.
+        getter = _make_method(
+            "tuple_getter",
+            "def tuple_getter(inst):\n    return ({0})\n".format(
+                "".join("inst." + name + "," for name in names)
+            ),
+            _generate_unique_filename(cls, "tuple_getter"),
+        )
+    _cache_on(cls, "__attrs_astuple__", key, getter)
+
+    return getter
+
+
+def iter_json(obj, filter=None, default=None):
+    """
+    Encode *obj* as JSON and return an iterator of the text in chunks.
+
+    ``attrs`` instances become objects of their attributes, just like
+    ``json.dumps(attr.asdict(obj))`` returns, but without building any
+    intermediate dicts or strings: each chunk is computed only when it's
+    asked for.  Therefore, memory use doesn't grow with the output and the
+    first chunk can be written right away, e.g. with
+    ``fp.writelines(attr.iter_json(obj))``.
+
+    Besides ``attrs`` instances, *obj* may contain everything `json.dumps`
+    encodes, sets, and iterators, which become arrays.  To stream many
+    instances, pass a generator of them.
+
+    :param obj: The object to encode.
+    :param callable filter: A callable whose return code determines whether an
+        attribute is included (``True``) or dropped (``False``).  Is called
+        with the `attr.Attribute` as the first argument and the value as the
+        second argument.
+    :param callable default: Called with objects that can't be encoded
+        otherwise and returns an object that can.  Like for `json.dumps`.
+
+    :rtype: iterator of `str`
+
+    :raise TypeError: If an object can't be encoded.
+    :raise ValueError: If *obj* contains itself.
+
+    .. versionadded:: 20.1.0
+    """
+    # The containers that are being encoded are kept in a list together with
+    # iterators of (text, value) pairs of their contents, whose value is
+    # NOTHING if there's only text.  The text in front of a container is
+    # held back until the container's first chunk, so that chunks aren't
+    # tiny.
+    markers = set()
+    stack = [(None, iter((("", obj),)))]
+    pending = ""
+    while stack:
+        for text, v in stack[-1][1]:
+            if v is NOTHING:
+                yield pending + text
+                pending = ""
+                continue
+
+            encode = _json_scalars.get(v.__class__)
+            if encode is not None:
+                yield pending + text + encode(v)
+                pending = ""
+                continue
+
+            key = id(v)
+            if key in markers:
+                raise ValueError("Circular reference detected")
+            markers.add(key)
+            pending += text
+            stack.append((v, _json_container(v, filter, default)))
+            break
+        else:
+            markers.discard(id(stack.pop()[0]))
+
+
+def _json_float(v):
+    """
+    Encode the float *v* like `json.dumps`.
+    """
+    if v != v:
+        return "NaN"
+    if v == _INFINITY:
+        return "Infinity"
+    if v == -_INFINITY:
+        return "-Infinity"
+
+    return float.__repr__(v)
+
+
+_INFINITY = float("inf")
+
+# JSON encoders of exact scalar types.
+_json_scalars = {
+    str: encode_basestring_ascii,
+    int: str,
+    float: _json_float,
+    bool: lambda v: "true" if v else "false",
+    type(None): lambda v: "null",
+}
+if PY2:
+    _json_scalars[type(u"")] = encode_basestring_ascii
+    _json_scalars[type(2 ** 64)] = str
+
+
+def _json_scalar(v):
+    """
+    Return the JSON text of *v* if it's a string, a number, a bool, or None.
+    Otherwise, return None.
+    """
+    encode = _json_scalars.get(v.__class__)
+    if encode is not None:
+        return encode(v)
+
+    # Subclasses, like enums.
+    if isinstance(v, (str, type(u""))):
+        return encode_basestring_ascii(v)
+    if isinstance(v, numbers.Integral):
+        return str(int(v))
+    if isinstance(v, float):
+        return _json_float(float(v))
+
+    return None
+
+
+def _json_container(v, filter, default):
+    """
+    Return an iterator of the ``(text, value)`` pairs that make up the JSON
+    text of *v*, which isn't of a type in `_json_scalars`.
+    """
+    cls = v.__class__
+    if has(cls):
+        return _json_attributes(v, _json_keys(cls), filter)
+    if isinstance(v, dict):
+        return _json_items(v)
+    if isinstance(v, (list, tuple, set, frozenset, Iterator)):
+        return _json_elements(v)
+    scalar = _json_scalar(v)
+    if scalar is not None:
+        return iter(((scalar, NOTHING),))
+    if default is not None:
+        return iter((("", default(v)),))
+
+    raise TypeError(
+        "Object of type {0} is not JSON serializable".format(cls.__name__)
+    )
+
+
+def _json_keys(cls):
+    """
+    Return the attributes of *cls* together with the JSON text of their
+    names as object keys and cache them on *cls*.
+    """
+    cache = getattr(cls, "__attrs_json__", None)
+    keys = cache.get(cls) if cache is not None else None
+    if keys is None:
+        keys = tuple(
+            (a, encode_basestring_ascii(a.name) + ": ") for a in fields(cls)
+        )
+        _cache_on(cls, "__attrs_json__", cls, keys)
+
+    return keys
+
+
+# Objects and arrays are bounded by data that's in memory anyway, so their
+# scalar members are collected into one chunk.
+
+
+def _json_attributes(inst, keys, filter):
+    text = "{"
+    sep = ""
+    for a, key in keys:
+        v = getattr(inst, a.name)
+        if filter is not None and not filter(a, v):
+            continue
+        encode = _json_scalars.get(v.__class__)
+        if encode is None:
+            yield text + sep + key, v
+            text = ""
+        else:
+            text += sep + key + encode(v)
+        sep = ", "
+    yield text + "}", NOTHING
+
+
+def _json_key(k):
+    """
+    Return the JSON text of the dict key *k*.
+    """
+    if isinstance(k, (str, type(u""))):
+        return encode_basestring_ascii(k)
+
+    key = _json_scalar(k)
+    if key is None:
+        raise TypeError(
+            "keys must be str, int, float, bool or None, "
+            "not {0}".format(k.__class__.__name__)
+        )
+
+    return '"' + key + '"'
+
+
+def _json_items(d):
+    text = "{"
+    sep = ""
+    for k, v in iteritems(d):
+        key = _json_key(k)
+        encode = _json_scalars.get(v.__class__)
+        if encode is None:
+            yield text + sep + key + ": ", v
+            text = ""
+        else:
+            text += sep + key + ": " + encode(v)
+        sep = ", "
+    yield text + "}", NOTHING
+
+
+def _json_elements(iterable):
+    # Iterators may be arbitrarily long, so each element is a chunk.
+    text = "["
+    for v in iterable:
+        yield text, v
+        text = ", "
+    yield ("[]" if text == "[" else "]"), NOTHING
+
+
+def json_encoder(cls, filter=None):
+    """
+    Return a function that encodes an instance of *cls* as JSON and returns
+    the text.
+
+    The text is the same as ``json.dumps(attr.asdict(inst, filter=filter))``
+    and `attr.iter_json` return, but it's built straight from the attribute
+    values by a function that is generated for *cls* and cached.  Other
+    ``attrs`` classes it encounters get their own.
+
+    :param type cls: Class with ``attrs`` attributes.
+    :param callable filter: A callable whose return code determines whether an
+        attribute is included (``True``) or dropped (``False``).  Is called
+        with the `attr.Attribute` as the first argument and the value as the
+        second argument.  For example, pass ``lambda a, v: a.repr`` to only
+        include the attributes that are in the ``repr``.
+
+    :rtype: callable
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+
+    .. versionadded:: 20.1.0
+    """
+    encode = _get_json_encode(cls)
+
+    def encode_json(inst):
+        try:
+            return encode(inst, filter)
+        except RecursionError:
+            if not _recursed_too_deep(sys.exc_info()[2]):
+                raise
+
+        # Too deep to recurse or circular: iter_json handles both.
+        return "".join(iter_json(inst, filter))
+
+    return encode_json
+
+
+def _get_json_encode(cls):
+    """
+    Return the generated JSON encoder for instances of *cls*.
+    """
+    cache = getattr(cls, "__attrs_json__", None)
+    encode = cache.get((cls, "encode")) if cache is not None else None
+    if encode is None:
+        encode = _make_json_encode(cls)
+
+    return encode
+
+
+_json_encode_tmpl = """\
+{indent}_e = _json_scalars.get(_{i}.__class__)
+{indent}_{i} = _e(_{i}) if _e is not None else _json_text(_{i}, filter)"""
+
+
+def _make_json_encode(cls):
+    """
+    Return a function that encodes instances of *cls* as JSON, and cache it
+    on *cls*.
+
+    Values of the types in `_json_scalars` are encoded in place; all others
+    go through `_json_text`.  If there's a filter, the values it drops
+    aren't encoded at all.
+    """
+    attrs = fields(cls)
+    keys = [encode_basestring_ascii(a.name) + ": " for a in attrs]
+    globs = {"_json_scalars": _json_scalars, "_json_text": _json_text}
+    lines = ["def encode(inst, filter):"]
+    for i, a in enumerate(attrs):
+        lines.append("    _{0} = inst.{1}".format(i, a.name))
+        globs["_a{0}".format(i)] = a
+
+    lines.append("    if filter is None:")
+    pieces = []
+    for i, key in enumerate(keys):
+        lines.append(_json_encode_tmpl.format(i=i, indent="        "))
+        pieces.append(repr(("{" if i == 0 else ", ") + key))
+        pieces.append("_{0}".format(i))
+    if pieces:
+        lines.append(
+            "        return ''.join(({0}, '}}'))".format(", ".join(pieces))
+        )
+    else:
+        lines.append("        return '{}'")
+
+    lines.append("    parts = []")
+    for i, key in enumerate(keys):
+        lines.append("    if filter(_a{0}, _{0}):".format(i))
+        lines.append(_json_encode_tmpl.format(i=i, indent="        "))
+        lines.append("        parts.append({0!r} + _{1})".format(key, i))
+    lines.append("    return '{' + ', '.join(parts) + '}'")
+
+    encode = _make_method(
+        "encode",
+        "\n".join(lines) + "\n",
+        _generate_unique_filename(cls, "json_encoder"),
+        globs,
+    )
+    _cache_on(cls, "__attrs_json__", (cls, "encode"), encode)
+
+    return encode
+
+
+def _json_text(v, filter):
+    """
+    Return the JSON text of *v*, which isn't of a type in `_json_scalars`.
+
+    ``attrs`` instances, lists, tuples, and dicts are encoded by recursing;
+    everything else by `iter_json`.
+    """
+    cls = v.__class__
+    if getattr(cls, "__attrs_attrs__", None) is not None:
+        return _get_json_encode(cls)(v, filter)
+
+    if cls is list or cls is tuple:
+        parts = []
+        for i in v:
+            encode = _json_scalars.get(i.__class__)
+            parts.append(
+                encode(i) if encode is not None else _json_text(i, filter)
+            )
+        return "[" + ", ".join(parts) + "]"
+
+    if cls is dict:
+        parts = []
+        for k, i in iteritems(v):
+            encode = _json_scalars.get(i.__class__)
+            parts.append(
+                _json_key(k)
+                + ": "
+                + (encode(i) if encode is not None else _json_text(i, filter))
+            )
+        return "{" + ", ".join(parts) + "}"
+
+    return "".join(iter_json(v, filter))
+
+
+def from_dict(cls, data):
+    """
+    Return a new instance of *cls* from the dict *data* of attribute values,
+    like `attr.asdict` returns.
+
+    The values are passed to ``__init__``: by the attribute names without
+    leading underscores, like `attr.evolve` does, and in the order of
+    ``__init__`` if possible.  Attributes without a key get their defaults.
+    Other keys, e.g. of attributes that aren't initialized by ``__init__``,
+    are ignored.
+
+    Values of attributes whose *type* is an ``attrs`` class are created
+    from dicts, too, as are elements of lists, tuples, sequences, and
+    values of dicts and mappings if it is a corresponding generic type
+    from `typing`, e.g. ``typing.List[C]``.  ``typing.Optional`` is
+    supported as well.  Types that are strings, like forward references,
+    are ignored.
+
+    The loop over the attributes is unrolled into a function that is
+    generated for *cls* and cached, so it's almost as fast as calling *cls*
+    with the values by hand.
+
+    :param type cls: Class with ``attrs`` attributes.
+    :param dict data: Attribute values by the names of their attributes.
+
+    :rtype: *cls*
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If an attribute without a default has no key.
+
+    .. versionadded:: 20.1.0
+    """
+    return _get_from_dict(cls)(data)
+
+
+def _get_from_dict(cls):
+    """
+    Return the generated function that creates instances of *cls* from
+    dicts.
+    """
+    cache = getattr(cls, "__attrs_from_dict__", None)
+    build = cache.get(cls) if cache is not None else None
+    if build is None:
+        build = _make_from_dict(cls)
+
+    return build
+
+
+def _make_from_dict(cls):
+    """
+    Return a function that creates an instance of *cls* from a dict like
+    `from_dict` and cache it on *cls*.
+    """
+    globs = {
+        "NOTHING": NOTHING,
+        "_cls": cls,
+        "_missing": "Missing key {0!r} for " + cls.__name__ + ".",
+    }
+    # Keys without defaults are looked up first, all in one try block.
+    required = []
+    structure_required = []
+    optional = []
+    args = []
+    kw_args = []
+    for i, a in enumerate(fields(cls)):
+        if not a.init:
+            continue
+
+        var = "_{0}".format(i)
+        if isclass(a.type) and has(a.type):
+            # Common enough to spare the call of a structurer.
+            globs["_build" + var] = _get_from_dict(a.type)
+            structure = (
+                "{0} = _build{0}({0}) if isinstance({0}, dict) else {0}"
+            )
+        else:
+            structure = _structurer(a.type)
+            if structure is not None:
+                globs["_structure" + var] = structure
+                structure = "{0} = _structure{0}({0})"
+        if structure is not None:
+            structure = structure.format(var)
+
+        if a.default is NOTHING:
+            required.append("        {0} = data[{1!r}]".format(var, a.name))
+            if structure is not None:
+                structure_required.append("    " + structure)
+        elif isinstance(a.default, Factory):
+            # __init__ calls the factory if the argument is NOTHING.
+            optional.append(
+                "    {0} = _get({1!r}, NOTHING)".format(var, a.name)
+            )
+            if structure is not None:
+                optional.append("    if {0} is not NOTHING:".format(var))
+                optional.append("        " + structure)
+        else:
+            globs["_default" + var] = a.default
+            optional.append(
+                "    {0} = _get({1!r}, _default{0})".format(var, a.name)
+            )
+            if structure is not None:
+                optional.append("    if {0} is not _default{0}:".format(var))
+                optional.append("        " + structure)
+
+        if a.kw_only:
+            kw_args.append("{0}={1}".format(a.name.lstrip("_"), var))
+        else:
+            args.append(var)
+
+    lines = ["def from_dict(data):"]
+    if required:
+        lines.append("    try:")
+        lines.extend(required)
+        lines.append("    except KeyError as e:")
+        lines.append("        raise TypeError(_missing.format(e.args[0]))")
+        lines.extend(structure_required)
+    if optional:
+        lines.append("    _get = data.get")
+        lines.extend(optional)
+    lines.append("    return _cls({0})".format(", ".join(args + kw_args)))
+
+    build = _make_method(
+        "from_dict",
+        "\n".join(lines) + "\n",
+        _generate_unique_filename(cls, "from_dict"),
+        globs,
+    )
+    _cache_on(cls, "__attrs_from_dict__", cls, build)
+
+    return build
+
+
+def _structurer(type_):
+    """
+    Return a function that creates instances of the ``attrs`` classes that
+    *type_* refers to in values of *type_*, or None if there are none.
+
+    Values that aren't dicts or sequences, like None, are returned as they
+    are.
+    """
+    origin = getattr(type_, "__origin__", None)
+    args = getattr(type_, "__args__", None) or ()
+    if origin is None and type_.__class__.__name__ != "UnionType":
+        if isclass(type_) and has(type_):
+            build = _get_from_dict(type_)
+            return lambda v: build(v) if isinstance(v, dict) else v
+        return None
+
+    if origin is None or repr(origin) == "typing.Union":
+        # Of all unions, only Optional[T] is unambiguous.
+        args = [t for t in args if t is not type(None)]
+        return _structurer(args[0]) if len(args) == 1 else None
+
+    if not isclass(origin):
+        return None
+
+    if issubclass(origin, Mapping):
+        structure = _structurer(args[1]) if len(args) == 2 else None
+        if structure is None:
+            return None
+        return (
+            lambda v: dict((k, structure(i)) for k, i in iteritems(v))
+            if isinstance(v, dict)
+            else v
+        )
+
+    if issubclass(origin, tuple):
+        # Python 3.6 drops the ellipsis of Tuple[T, ...] from the arguments.
+        if not (
+            len(args) == 2
+            and args[1] is Ellipsis
+            or len(args) == 1
+            and getattr(type_, "__tuple_use_ellipsis__", False)
+        ):
+            return None
+        structure = _structurer(args[0])
+        if structure is None:
+            return None
+        return (
+            lambda v: tuple([structure(i) for i in v])
+            if isinstance(v, (list, tuple))
+            else v
+        )
+
+    if issubclass(origin, Sequence) and len(args) == 1:
+        structure = _structurer(args[0])
+        if structure is None:
+            return None
+        return (
+            lambda v: [structure(i) for i in v]
+            if isinstance(v, (list, tuple))
+            else v
+        )
+
+    return None
+
+
+def _cache_on(cls, name, key, value):
+    """
+    Store *value* under *key* in the cache called *name* in the dict of
+    *cls*.
+    """
+    cache = cls.__dict__.get(name)
+    if cache is None:
+        cache = {}
+        type.__setattr__(cls, name, cache)
+    cache[key] = value
+
+
 def has(cls):
     """
     Check whether *cls* is a class with ``attrs`` attributes.
@@ -288,3 +1342,79 @@ def evolve(inst, **changes):
         if init_name not in changes:
             changes[init_name] = getattr(inst, attr_name)
     return cls(**changes)
+
+
+def sort_key(cls):
+    """
+    Return a key function that orders instances of *cls* like its generated
+    ordering methods do.
+
+    The key is implemented in C, so sorting with it is much faster than
+    comparing the instances themselves.
+
+    :param type cls: Class with ``attrs`` attributes.
+
+    :rtype: callable
+
+    :raise attr.exceptions.NotAnAttrsClassError: If *cls* is not an ``attrs``
+        class.
+    :raise TypeError: If *cls* is not ordered by ``attrs`` (e.g. because it
+        has been created with ``order=False``).
+
+    .. versionadded:: 20.1.0
+    """
+    fields(cls)  # Make sure it's an attrs class at all.
+    owner = _ordered_by(cls)
+    if owner is None:
+        raise TypeError(
+            "{0} is not ordered by attrs.  Use order=True.".format(
+                cls.__name__
+            )
+        )
+
+    names = [a.name for a in fields(owner) if a.order]
+    if not names:
+        return _no_key
+    if len(names) == 1:
+        # A single name would make the key the bare value, but we have to
+        # compare like a tuple does: identical values are always equal.
+        names *= 2
+
+    return attrgetter(*names)
+
+
+def _no_key(inst):
+    """
+    Key for classes without attributes to order by: all instances are equal.
+    """
+    return ()
+
+
+def sort_instances(instances, reverse=False):
+    """
+    Return a new sorted list of *instances*, using `attr.sort_key`.
+
+    :param instances: Instances of *one* ``attrs`` class.
+    :type instances: iterable
+    :param bool reverse: Sort in descending order.
+
+    :rtype: list
+
+    :raise TypeError: If *instances* are of more than one class.
+    :raise attr.exceptions.NotAnAttrsClassError: If *instances* are not
+        instances of an ``attrs`` class.
+
+    .. versionadded:: 20.1.0
+    """
+    instances = list(instances)
+    if not instances:
+        return instances
+
+    classes = set(map(type, instances))
+    if len(classes) != 1:
+        names = ", ".join(sorted(c.__name__ for c in classes))
+        raise TypeError(
+            "Can only sort instances of one class, got {0}.".format(names)
+        )
+
+    return sorted(instances, key=sort_key(classes.pop()), reverse=reverse)
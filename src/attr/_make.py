@@ -1,13 +1,17 @@
 from __future__ import absolute_import, division, print_function
 
 import copy
+import hashlib
 import linecache
+import marshal
+import os
 import sys
 import threading
-import uuid
+import types
 import warnings
+import weakref
 
-from operator import itemgetter
+from operator import attrgetter, ge, gt, itemgetter, le, lt
 
 from . import _config
 from ._compat import (
@@ -16,6 +20,7 @@ from ._compat import (
     iteritems,
     metadata_proxy,
     ordered_dict,
+    perf_counter,
     set_closure_cell,
 )
 from .exceptions import (
@@ -31,9 +36,6 @@ from .exceptions import (
 _obj_setattr = object.__setattr__
 _init_converter_pat = "__attr_converter_{}"
 _init_factory_pat = "__attr_factory_{}"
-_tuple_property_pat = (
-    "    {attr_name} = _attrs_property(_attrs_itemgetter({index}))"
-)
 _classvar_prefixes = ("typing.ClassVar", "t.ClassVar", "ClassVar")
 # we don't use a double-underscore prefix because that triggers
 # name mangling when trying to create a slot for the field
@@ -228,6 +230,234 @@ def attrib(
     )
 
 
+def _code_cache_path(cache_dir, script, filename):
+    """
+    Return the path of the cache file for *script* compiled as *filename*.
+
+    The key covers everything that influences the resulting byte code: the
+    ``attrs`` version, the interpreter, the file name -- which contains the
+    qualified class name -- and the source that has been generated from the
+    attribute specification.
+    """
+    # Imported lazily because attr/__init__.py imports us before it defines
+    # its metadata.
+    from . import __version__
+
+    key = hashlib.sha256(
+        "\0".join((__version__, sys.version, filename, script)).encode("utf-8")
+    ).hexdigest()
+
+    return os.path.join(cache_dir, key + ".attrs-code")
+
+
+def _load_cached_code(path):
+    """
+    Load a code object from *path*.  Return ``None`` if it's missing or
+    unusable.
+    """
+    try:
+        with open(path, "rb") as f:
+            code = marshal.load(f)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(code, types.CodeType):
+        return None
+
+    return code
+
+
+def _store_cached_code(path, code):
+    """
+    Write *code* to *path*.
+
+    The cache is strictly best-effort, so failures are ignored.  We write to a
+    temporary file first and rename it afterwards such that concurrent
+    interpreters never see a partially written file.
+    """
+    tmp_path = "{0}.{1}-{2}.tmp".format(path, os.getpid(), id(code))
+    try:
+        cache_dir = os.path.dirname(path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(code, f)
+        _replace_file(tmp_path, path)
+    except (IOError, OSError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# os.replace() is Python 3-only; os.rename() is atomic on POSIX, too.
+_replace_file = getattr(os, "replace", os.rename)
+
+
+# Code objects of generated scripts, keyed by the script.  Classes with the
+# same shape (attribute names, kinds of defaults, presence of converters and
+# validators, frozen, slots, ...) generate identical scripts, so they can share
+# the byte code and only need their own globals.  The cache holds at most
+# `_code_cache_size` entries; the least recently used ones are dropped first.
+_code_cache = ordered_dict()
+_code_cache_size = 256
+
+
+def _cache_code(script, code):
+    """
+    Remember *code* as the compiled form of *script* and evict the least
+    recently used entries if the cache has grown too big.
+    """
+    _code_cache[script] = code
+    while len(_code_cache) > _code_cache_size:
+        try:
+            del _code_cache[next(iter(_code_cache))]
+        except (KeyError, RuntimeError, StopIteration):
+            # Another thread got there first.
+            break
+
+
+if sys.version_info >= (3, 8):
+
+    def _with_filename(code, filename):
+        """
+        Return *code* with its file name -- and those of the code objects
+        it contains -- set to *filename*.
+        """
+        return code.replace(
+            co_filename=filename,
+            co_consts=tuple(
+                _with_filename(c, filename)
+                if isinstance(c, types.CodeType)
+                else c
+                for c in code.co_consts
+            ),
+        )
+
+
+else:
+
+    def _with_filename(code, filename):
+        """
+        Older Pythons can't copy code objects conveniently.  Since the
+        scripts are identical, the file name we keep points to a linecache
+        entry with the correct source anyway.
+        """
+        return code
+
+
+def _compile_script(script, filename):
+    """
+    Compile *script* using *filename* as its file name.
+
+    Identical scripts are compiled only once per process.  If a code cache
+    directory has been set using `attr.set_code_cache_dir`, look up the byte
+    code there first and store it there after compiling.
+    """
+    code = _code_cache.pop(script, None)
+    if code is not None:
+        # Re-insert to mark it as the most recently used.
+        _code_cache[script] = code
+        if code.co_filename != filename:
+            code = _with_filename(code, filename)
+        return code
+
+    cache_dir = _config._code_cache_dir
+    if cache_dir is None:
+        code = compile(script, filename, "exec")
+    else:
+        path = _code_cache_path(cache_dir, script, filename)
+        code = _load_cached_code(path)
+        if code is None:
+            code = compile(script, filename, "exec")
+            _store_cached_code(path, code)
+
+    _cache_code(script, code)
+
+    return code
+
+
+# The timings of the class that is currently being built by this thread, if
+# someone is observing builds.  See `_timed`.
+_build_timings = threading.local()
+
+
+def _timed(timings, step, func, *args):
+    """
+    Call *func* with *args* and append how long it took to *timings* as
+    *step*.  If *timings* is ``None``, nobody is observing and we just call
+    *func*.
+
+    Compilations that happen while *func* runs are recorded, too.
+    """
+    if timings is None:
+        return func(*args)
+
+    outer = getattr(_build_timings, "timings", None)
+    _build_timings.timings = timings
+    index = len(timings)
+    timings.append(None)
+    start = perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings[index] = (step, perf_counter() - start)
+        _build_timings.timings = outer
+
+
+# Factories for the methods of generated scripts that have been compiled ahead
+# of time by `attr.codegen`, keyed by the script.  Calling a factory with the
+# globals of a class returns the method.
+_precompiled = {}
+
+# If not ``None``, the scripts `_make_method` is asked for are recorded here
+# along with the names of the methods they define.  Used by `attr.codegen`.
+_script_recorder = None
+
+
+def _make_method(name, script, filename, globs=None):
+    """
+    Create the method with the script given and return the method object.
+    """
+    locs = {}
+    if globs is None:
+        globs = {}
+
+    if _script_recorder is not None:
+        _script_recorder[script] = name
+
+    factory = _precompiled.get(script)
+    if factory is not None:
+        return types.FunctionType(factory, globs)()
+
+    timings = getattr(_build_timings, "timings", None)
+    if timings is None:
+        code = _compile_script(script, filename)
+    else:
+        start = perf_counter()
+        code = _compile_script(script, filename)
+        timings.append(("compile", perf_counter() - start))
+
+    eval(code, globs, locs)
+    _add_linecache(script, filename)
+
+    return locs[name]
+
+
+def _add_linecache(script, filename):
+    """
+    In order of debuggers like PDB being able to step through the code, we
+    add a fake linecache entry -- unless it has been switched off.
+    """
+    if _config._populate_linecache is True:
+        linecache.cache[filename] = (
+            len(script),
+            None,
+            script.splitlines(True),
+            filename,
+        )
+
+
 def _make_attr_tuple_class(cls_name, attr_names):
     """
     Create a tuple subclass to hold `Attribute`s for an `attrs` class.
@@ -238,22 +468,11 @@ def _make_attr_tuple_class(cls_name, attr_names):
         __slots__ = ()
         x = property(itemgetter(0))
     """
-    attr_class_name = "{}Attributes".format(cls_name)
-    attr_class_template = [
-        "class {}(tuple):".format(attr_class_name),
-        "    __slots__ = ()",
-    ]
-    if attr_names:
-        for i, attr_name in enumerate(attr_names):
-            attr_class_template.append(
-                _tuple_property_pat.format(index=i, attr_name=attr_name)
-            )
-    else:
-        attr_class_template.append("    pass")
-    globs = {"_attrs_itemgetter": itemgetter, "_attrs_property": property}
-    eval(compile("\n".join(attr_class_template), "", "exec"), globs)
+    body = {"__slots__": ()}
+    for i, attr_name in enumerate(attr_names):
+        body[attr_name] = property(itemgetter(i))
 
-    return globs[attr_class_name]
+    return type("{}Attributes".format(cls_name), (tuple,), body)
 
 
 # Tuple class for extracted attributes from a class definition.
@@ -441,10 +660,15 @@ class _ClassBuilder(object):
         "_frozen",
         "_weakref_slot",
         "_cache_hash",
+        "_eager_hash_type",
+        "_hash_filename",
         "_has_post_init",
         "_delete_attribs",
         "_base_attr_map",
         "_is_exc",
+        "_lazy",
+        "_observer",
+        "_timings",
     )
 
     def __init__(
@@ -458,9 +682,20 @@ class _ClassBuilder(object):
         kw_only,
         cache_hash,
         is_exc,
+        lazy,
+        eager_hash,
     ):
-        attrs, base_attrs, base_map = _transform_attrs(
-            cls, these, auto_attribs, kw_only
+        self._observer = _config._build_observer
+        self._timings = [] if self._observer is not None else None
+
+        attrs, base_attrs, base_map = _timed(
+            self._timings,
+            "transform_attrs",
+            _transform_attrs,
+            cls,
+            these,
+            auto_attribs,
+            kw_only,
         )
 
         self._cls = cls
@@ -473,9 +708,19 @@ class _ClassBuilder(object):
         self._frozen = frozen or _has_frozen_base_class(cls)
         self._weakref_slot = weakref_slot
         self._cache_hash = cache_hash
+        # __init__ and __hash__ must agree on the type hash if the former
+        # computes the hash code, so the file name of __hash__ -- which the
+        # type hash is derived from -- has to be known up front.
+        if eager_hash and cache_hash:
+            self._hash_filename = _generate_unique_filename(cls, "hash")
+            self._eager_hash_type = hash(self._hash_filename)
+        else:
+            self._hash_filename = None
+            self._eager_hash_type = None
         self._has_post_init = bool(getattr(cls, "__attrs_post_init__", False))
         self._delete_attribs = not bool(these)
         self._is_exc = is_exc
+        self._lazy = lazy
 
         self._cls_dict["__attrs_attrs__"] = self._attrs
 
@@ -493,9 +738,20 @@ class _ClassBuilder(object):
         Builder cannot be used after calling this method.
         """
         if self._slots is True:
-            return self._create_slots_class()
+            cls = _timed(
+                self._timings, "create_slots_class", self._create_slots_class
+            )
         else:
-            return self._patch_original_class()
+            cls = _timed(
+                self._timings,
+                "patch_original_class",
+                self._patch_original_class,
+            )
+
+        if self._timings is not None:
+            self._observer(cls, self._timings)
+
+        return cls
 
     def _patch_original_class(self):
         """
@@ -523,34 +779,6 @@ class _ClassBuilder(object):
         for name, value in self._cls_dict.items():
             setattr(cls, name, value)
 
-        # Attach __setstate__. This is necessary to clear the hash code
-        # cache on deserialization. See issue
-        # https://github.com/python-attrs/attrs/issues/482 .
-        # Note that this code only handles setstate for dict classes.
-        # For slotted classes, see similar code in _create_slots_class .
-        if self._cache_hash:
-            existing_set_state_method = getattr(cls, "__setstate__", None)
-            if existing_set_state_method:
-                raise NotImplementedError(
-                    "Currently you cannot use hash caching if "
-                    "you specify your own __setstate__ method."
-                    "See https://github.com/python-attrs/attrs/issues/494 ."
-                )
-
-            # Clears the cached hash state on serialization; for frozen
-            # classes we need to bypass the class's setattr method.
-            if self._frozen:
-
-                def cache_hash_set_state(chss_self, _):
-                    object.__setattr__(chss_self, _hash_cache_field, None)
-
-            else:
-
-                def cache_hash_set_state(chss_self, _):
-                    setattr(chss_self, _hash_cache_field, None)
-
-            cls.__setstate__ = cache_hash_set_state
-
         return cls
 
     def _create_slots_class(self):
@@ -612,11 +840,10 @@ class _ClassBuilder(object):
             __bound_setattr = _obj_setattr.__get__(self, Attribute)
             for name, value in zip(state_attr_names, state):
                 __bound_setattr(name, value)
-            # Clearing the hash code cache on deserialization is needed
-            # because hash codes can change from run to run. See issue
-            # https://github.com/python-attrs/attrs/issues/482 .
-            # Note that this code only handles setstate for slotted classes.
-            # For dict classes, see similar code in _patch_original_class .
+            # The hash code cache slot isn't part of the state, so it's empty
+            # after deserialization.  Set it to None so the hash code is
+            # computed again when it's needed; it can change from run to run.
+            # See issue https://github.com/python-attrs/attrs/issues/482 .
             if hash_caching_enabled:
                 __bound_setattr(_hash_cache_field, None)
 
@@ -650,10 +877,12 @@ class _ClassBuilder(object):
         return cls
 
     def add_repr(self, ns):
-        self._cls_dict["__repr__"] = self._add_method_dunders(
-            _make_repr(self._attrs, ns=ns)
-        )
-        return self
+        attrs = self._attrs
+
+        def make(cls):
+            return (_make_repr(cls, attrs, ns=ns),)
+
+        return self._add_methods("add_repr", ("__repr__",), make)
 
     def add_str(self):
         repr = self._cls_dict.get("__repr__")
@@ -673,70 +902,206 @@ class _ClassBuilder(object):
         return self
 
     def add_hash(self):
-        self._cls_dict["__hash__"] = self._add_method_dunders(
-            _make_hash(
-                self._cls,
-                self._attrs,
-                frozen=self._frozen,
-                cache_hash=self._cache_hash,
+        attrs = self._attrs
+        frozen = self._frozen
+        cache_hash = self._cache_hash
+        unique_filename = self._hash_filename
+
+        def make(cls):
+            return (
+                _make_hash(
+                    cls,
+                    attrs,
+                    frozen=frozen,
+                    cache_hash=cache_hash,
+                    unique_filename=unique_filename,
+                ),
             )
-        )
 
-        return self
+        return self._add_methods("add_hash", ("__hash__",), make)
 
     def add_init(self):
-        self._cls_dict["__init__"] = self._add_method_dunders(
-            _make_init(
-                self._cls,
-                self._attrs,
-                self._has_post_init,
-                self._frozen,
-                self._slots,
-                self._cache_hash,
-                self._base_attr_map,
-                self._is_exc,
+        attrs = self._attrs
+        has_post_init = self._has_post_init
+        frozen = self._frozen
+        slots = self._slots
+        cache_hash = self._cache_hash
+        base_attr_map = self._base_attr_map
+        is_exc = self._is_exc
+        eager_hash_type = self._eager_hash_type
+
+        def make(cls):
+            return (
+                _make_init(
+                    cls,
+                    attrs,
+                    has_post_init,
+                    frozen,
+                    slots,
+                    cache_hash,
+                    base_attr_map,
+                    is_exc,
+                    eager_hash_type,
+                ),
+            )
+
+        return self._add_methods("add_init", ("__init__",), make)
+
+    def add_interning_init(self):
+        """
+        Add a ``__new__`` that initializes instances and returns the canonical
+        instance instead of an ``__init__``.
+
+        Never lazy because ``__new__`` is looked up on the class by Python.
+        """
+        if "__reduce__" in self._cls.__dict__:
+            raise NotImplementedError(
+                "Currently you cannot intern instances if you specify your "
+                "own __reduce__ method."
             )
+
+        slots = self._slots
+        intern = _make_interner(self._attrs)
+        __new__ = _timed(
+            self._timings,
+            "add_init",
+            _make_init,
+            self._cls,
+            self._attrs,
+            self._has_post_init,
+            self._frozen,
+            slots,
+            self._cache_hash,
+            self._base_attr_map,
+            self._is_exc,
+            self._eager_hash_type,
+            intern,
         )
 
+        def __init__(self, *args, **kwargs):
+            # Instances are initialized by __new__ already.
+            pass
+
+        def __reduce__(self):
+            return (
+                _unpickle_interned,
+                (
+                    self.__class__,
+                    self.__getstate__() if slots else self.__dict__,
+                ),
+            )
+
+        cd = self._cls_dict
+        cd["__new__"] = staticmethod(self._add_method_dunders(__new__))
+        cd["__init__"] = self._add_method_dunders(__init__)
+        cd["__reduce__"] = self._add_method_dunders(__reduce__)
+        cd["__attrs_intern__"] = staticmethod(intern)
+
         return self
 
     def add_eq(self):
-        cd = self._cls_dict
+        attrs = self._attrs
 
-        cd["__eq__"], cd["__ne__"] = (
-            self._add_method_dunders(meth)
-            for meth in _make_eq(self._cls, self._attrs)
-        )
+        def make(cls):
+            return (_make_eq(cls, attrs)[0],)
 
-        return self
+        self._cls_dict["__ne__"] = self._add_method_dunders(__ne__)
+
+        return self._add_methods("add_eq", ("__eq__",), make)
 
     def add_order(self):
-        cd = self._cls_dict
+        attrs = self._attrs
 
-        cd["__lt__"], cd["__le__"], cd["__gt__"], cd["__ge__"] = (
-            self._add_method_dunders(meth)
-            for meth in _make_order(self._cls, self._attrs)
+        def make(cls):
+            return _make_order(cls, attrs)
+
+        return self._add_methods(
+            "add_order", ("__lt__", "__le__", "__gt__", "__ge__"), make
         )
 
+    def _add_methods(self, step, names, make):
+        """
+        Add the methods called *names* that are returned by ``make(cls)`` and
+        record the time it took as *step* if the build is observed.
+
+        If the class is lazy, add placeholders that call *make* on first
+        access instead.  *make* must not hold on to the builder or the
+        original class because that would keep both alive for slotted classes.
+        """
+        cd = self._cls_dict
+        if self._lazy:
+            for name in names:
+                cd[name] = _LazyMethod(name, names, make)
+        else:
+            methods = _timed(self._timings, step, make, self._cls)
+            for name, method in zip(names, methods):
+                cd[name] = self._add_method_dunders(method)
+
         return self
 
     def _add_method_dunders(self, method):
         """
         Add __module__ and __qualname__ to a *method* if possible.
         """
-        try:
-            method.__module__ = self._cls.__module__
-        except AttributeError:
-            pass
+        return _add_method_dunders(self._cls, method)
 
-        try:
-            method.__qualname__ = ".".join(
-                (self._cls.__qualname__, method.__name__)
-            )
-        except AttributeError:
-            pass
 
-        return method
+def _add_method_dunders(cls, method):
+    """
+    Add __module__ and __qualname__ of *cls* to a *method* if possible.
+    """
+    try:
+        method.__module__ = cls.__module__
+    except AttributeError:
+        pass
+
+    try:
+        method.__qualname__ = ".".join((cls.__qualname__, method.__name__))
+    except AttributeError:
+        pass
+
+    return method
+
+
+class _LazyMethod(object):
+    """
+    Placeholder for a generated method that is only generated once it's
+    accessed for the first time.
+
+    *make* is called with the class the placeholder is attached to and
+    returns the methods for all *names* at once, since they're usually
+    generated together.  They replace their placeholders on the class, so
+    the placeholder is only ever hit once.
+    """
+
+    __slots__ = ("name", "names", "make")
+
+    def __init__(self, name, names, make):
+        self.name = name
+        self.names = names
+        self.make = make
+
+    def __repr__(self):
+        return "<lazy attrs method {0}>".format(self.name)
+
+    def __get__(self, instance, owner):
+        # The placeholder may be inherited, so look up the class it has been
+        # attached to.
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.name) is self:
+                break
+        else:  # pragma: no cover
+            cls = owner
+
+        for name, meth in zip(self.names, self.make(cls)):
+            lazy = cls.__dict__.get(name)
+            if not isinstance(lazy, _LazyMethod) or lazy.make is not self.make:
+                # Replaced by someone else in the meantime; leave it alone.
+                continue
+
+            type.__setattr__(cls, name, _add_method_dunders(cls, meth))
+
+        return cls.__dict__[self.name].__get__(instance, owner)
 
 
 _CMP_DEPRECATION = (
@@ -790,6 +1155,9 @@ def attrs(
     auto_exc=False,
     eq=None,
     order=None,
+    lazy=False,
+    eager_hash=False,
+    intern=False,
 ):
     r"""
     A class decorator that adds `dunder
@@ -910,6 +1278,10 @@ def attrs(
         fields involved in hash code computation or mutations of the objects
         those fields point to after object creation.  If such changes occur,
         the behavior of the object's hash code is undefined.
+    :param bool eager_hash: Compute the cached hash code at the end of
+        ``__init__`` instead of on the first call to ``__hash__``.  Requires
+        *cache_hash*.  Copies and unpickled instances still compute their
+        hash code lazily.
     :param bool auto_exc: If the class subclasses `BaseException`
         (which implicitly includes any subclass of any exception), the
         following happens to behave like a well-behaved Python exceptions
@@ -923,6 +1295,20 @@ def attrs(
           default value are additionally available as a tuple in the ``args``
           attribute,
         - the value of *str* is ignored leaving ``__str__`` to base classes.
+    :param bool lazy: Don't generate ``__init__``, ``__repr__``, ``__eq__``,
+        ``__hash__``, and the ordering methods when the class is created,
+        but the first time they're accessed.  This makes defining many
+        classes faster if most of their methods are never used.  The class
+        behaves exactly the same otherwise.
+    :param bool intern: Make instantiation return an existing instance if
+        one whose attributes are all equal is still alive, so that equal
+        instances are the *same* object and take up memory only once.  Equal
+        means equal as compared by ``__eq__``, so ``C(1) is C(1.0)`` and the
+        first of the two instances wins.  Instances with unhashable attributes
+        aren't shared.  Requires *frozen*, *eq*, and *init* to be ``True``,
+        and a ``__weakref__`` slot if *slots* is ``True``.  Subclasses must
+        be interning, too, and the class can't define its own
+        ``__reduce__``.
 
     .. versionadded:: 16.0.0 *slots*
     .. versionadded:: 16.1.0 *frozen*
@@ -948,6 +1334,12 @@ def attrs(
     .. versionadded:: 19.1.0 *auto_exc*
     .. deprecated:: 19.2.0 *cmp* Removal on or after 2021-06-01.
     .. versionadded:: 19.2.0 *eq* and *order*
+    .. versionadded:: 20.1.0 *lazy*
+    .. versionadded:: 20.1.0 *eager_hash*
+    .. versionadded:: 20.1.0 *intern*
+    .. versionchanged:: 20.1.0
+       *cache_hash* works with custom ``__setstate__`` methods, and copies
+       made by `copy.deepcopy` of dict classes keep their attributes.
     """
     eq, order = _determine_eq_order(cmp, eq, order)
 
@@ -968,6 +1360,8 @@ def attrs(
             kw_only,
             cache_hash,
             is_exc,
+            lazy,
+            eager_hash,
         )
 
         if repr is True:
@@ -1006,7 +1400,30 @@ def attrs(
                 )
             builder.make_unhashable()
 
-        if init is True:
+        if not intern and hasattr(cls, "__attrs_intern__"):
+            # The inherited __new__ would initialize instances using the
+            # attributes of the base class.
+            raise TypeError(
+                "Invalid value for intern.  Subclasses of interning classes"
+                " must be interning, too."
+            )
+        if intern:
+            if not (frozen is True and eq is True and init is True):
+                raise TypeError(
+                    "Invalid value for intern.  To intern instances, frozen,"
+                    " eq, and init must be True."
+                )
+            if slots is True and weakref_slot is not True:
+                raise TypeError(
+                    "Invalid value for intern.  To intern instances of slotted"
+                    " classes, weakref_slot must be True."
+                )
+            if is_exc:
+                raise TypeError(
+                    "Invalid value for intern.  Exceptions can't be interned."
+                )
+            builder.add_interning_init()
+        elif init is True:
             builder.add_init()
         else:
             if cache_hash:
@@ -1015,6 +1432,12 @@ def attrs(
                     " init must be True."
                 )
 
+        if eager_hash and not cache_hash:
+            raise TypeError(
+                "Invalid value for eager_hash.  To compute hash codes eagerly,"
+                " cache_hash must be True."
+            )
+
         return builder.build_class()
 
     # maybe_cls's type depends on the usage of the decorator.  It's a class
@@ -1056,51 +1479,49 @@ else:
         return cls.__setattr__ == _frozen_setattrs
 
 
-def _attrs_to_tuple(obj, attrs):
-    """
-    Create a tuple of all values of *obj*'s *attrs*.
-    """
-    return tuple(getattr(obj, a.name) for a in attrs)
+# How many methods of each kind have been generated for classes of each
+# qualified name.  Used to keep the file names of generated methods unique.
+_unique_filename_counts = {}
+_unique_filename_lock = threading.Lock()
 
 
 def _generate_unique_filename(cls, func_name):
     """
     Create a "filename" suitable for a function being generated.
+
+    The file name is deterministic: the first class with a certain qualified
+    name gets the plain name, later classes with the same name (e.g. created
+    in a loop using `make_class`) get a running counter appended.
     """
-    unique_id = uuid.uuid4()
-    extra = ""
-    count = 1
+    base = "{0} {1}.{2}".format(
+        func_name, cls.__module__, getattr(cls, "__qualname__", cls.__name__)
+    )
+    with _unique_filename_lock:
+        count = _unique_filename_counts.get(base, 0) + 1
+        _unique_filename_counts[base] = count
 
-    while True:
-        unique_filename = "<attrs generated {0} {1}.{2}{3}>".format(
-            func_name,
-            cls.__module__,
-            getattr(cls, "__qualname__", cls.__name__),
-            extra,
-        )
-        # To handle concurrency we essentially "reserve" our spot in
-        # the linecache with a dummy line.  The caller can then
-        # set this value correctly.
-        cache_line = (1, None, (str(unique_id),), unique_filename)
-        if (
-            linecache.cache.setdefault(unique_filename, cache_line)
-            == cache_line
-        ):
-            return unique_filename
+    if count == 1:
+        return "<attrs generated {0}>".format(base)
 
-        # Looks like this spot is taken. Try again.
-        count += 1
-        extra = "-{0}".format(count)
+    return "<attrs generated {0}-{1}>".format(base, count)
 
 
-def _make_hash(cls, attrs, frozen, cache_hash):
-    attrs = tuple(
+def _hash_attrs(attrs):
+    """
+    Return the attributes of *attrs* that are part of the hash.
+    """
+    return tuple(
         a for a in attrs if a.hash is True or (a.hash is None and a.eq is True)
     )
 
+
+def _make_hash(cls, attrs, frozen, cache_hash, unique_filename=None):
+    attrs = _hash_attrs(attrs)
+
     tab = "        "
 
-    unique_filename = _generate_unique_filename(cls, "hash")
+    if unique_filename is None:
+        unique_filename = _generate_unique_filename(cls, "hash")
     type_hash = hash(unique_filename)
 
     method_lines = ["def __hash__(self):"]
@@ -1112,7 +1533,7 @@ def _make_hash(cls, attrs, frozen, cache_hash):
         a value which is then cached, depending on the value of cache_hash
         """
         method_lines.extend(
-            [indent + prefix + "hash((", indent + "        %d," % (type_hash,)]
+            [indent + prefix + "hash((", indent + "        type_hash,"]
         )
 
         for a in attrs:
@@ -1124,33 +1545,53 @@ def _make_hash(cls, attrs, frozen, cache_hash):
         method_lines.append(tab + "if self.%s is None:" % _hash_cache_field)
         if frozen:
             append_hash_computation_lines(
-                "object.__setattr__(self, '%s', " % _hash_cache_field, tab * 2
+                "object.__setattr__(self, '%s', _CacheHashWrapper("
+                % (_hash_cache_field,),
+                tab * 2,
             )
-            method_lines.append(tab * 2 + ")")  # close __setattr__
+            method_lines.append(tab * 2 + "))")  # close __setattr__
         else:
             append_hash_computation_lines(
-                "self.%s = " % _hash_cache_field, tab * 2
+                "self.%s = _CacheHashWrapper(" % _hash_cache_field, tab * 2
             )
+            method_lines.append(tab * 2 + ")")  # close _CacheHashWrapper
         method_lines.append(tab + "return self.%s" % _hash_cache_field)
     else:
         append_hash_computation_lines("return ", tab)
 
     script = "\n".join(method_lines)
-    globs = {}
-    locs = {}
-    bytecode = compile(script, unique_filename, "exec")
-    eval(bytecode, globs, locs)
-
-    # In order of debuggers like PDB being able to step through the code,
-    # we add a fake linecache entry.
-    linecache.cache[unique_filename] = (
-        len(script),
-        None,
-        script.splitlines(True),
+    # The type hash is passed as a global instead of being inlined into the
+    # script because it differs between interpreter runs which would make the
+    # script uncacheable.
+    return _make_method(
+        "__hash__",
+        script,
         unique_filename,
+        {"type_hash": type_hash, "_CacheHashWrapper": _CacheHashWrapper},
     )
 
-    return locs["__hash__"]
+
+class _CacheHashWrapper(int):
+    """
+    An integer subclass that pickles and copies as ``None``.
+
+    Cached hash codes are wrapped in it to avoid serializing them: they are
+    likely invalid in another interpreter.  Since ``None`` means that the hash
+    code hasn't been computed yet, copies compute it again when they need it.
+    That way, we don't need our own ``__setstate__`` to clear the cache.
+    """
+
+    if PY2:
+        # For some reason `type(None)` isn't callable in Python 2, but we don't
+        # actually need a constructor for None objects, we just need any
+        # available function that returns None.
+        def __reduce__(self, _none_constructor=getattr, _args=(0, "", None)):
+            return _none_constructor, _args
+
+    else:
+
+        def __reduce__(self, _none_constructor=type(None), _args=()):
+            return _none_constructor, _args
 
 
 def _add_hash(cls, attrs):
@@ -1182,84 +1623,115 @@ def _make_eq(cls, attrs):
         "    if other.__class__ is not self.__class__:",
         "        return NotImplemented",
     ]
-    # We can't just do a big self.x = other.x and... clause due to
+    # We can't just do a big self.x == other.x and... clause due to
     # irregularities like nan == nan is false but (nan,) == (nan,) is true.
+    # Therefore we compare like tuples do -- identity first, then equality --
+    # but stop at the first difference without fetching the other fields.
     if attrs:
-        lines.append("    return  (")
-        others = ["    ) == ("]
-        for a in attrs:
-            lines.append("        self.%s," % (a.name,))
-            others.append("        other.%s," % (a.name,))
-
-        lines += others + ["    )"]
+        checks = [
+            "(self.{0} is other.{0} or self.{0} == other.{0})".format(a.name)
+            for a in attrs
+        ]
+        lines += [
+            "    if other is self:",
+            "        return True",
+            "    return bool(",
+            "        " + "\n        and ".join(checks),
+            "    )",
+        ]
     else:
         lines.append("    return True")
 
     script = "\n".join(lines)
-    globs = {}
-    locs = {}
-    bytecode = compile(script, unique_filename, "exec")
-    eval(bytecode, globs, locs)
-
-    # In order of debuggers like PDB being able to step through the code,
-    # we add a fake linecache entry.
-    linecache.cache[unique_filename] = (
-        len(script),
-        None,
-        script.splitlines(True),
-        unique_filename,
-    )
-    return locs["__eq__"], __ne__
+
+    return _make_method("__eq__", script, unique_filename), __ne__
 
 
 def _make_order(cls, attrs):
     attrs = [a for a in attrs if a.order]
 
-    def attrs_to_tuple(obj):
-        """
-        Save us some typing.
-        """
-        return _attrs_to_tuple(obj, attrs)
+    # Tuples are compared by looking for the first pair of items that are
+    # neither identical nor equal and comparing those.  If there is none, the
+    # result depends on the operator alone since the tuples are equally long.
+    # We do the same without building the tuples first.  All four methods
+    # share one generated function to keep class creation cheap.
+    unique_filename = _generate_unique_filename(cls, "order")
+    lines = [
+        "def __attrs_order__(self, other, op, result_if_equal):",
+        "    if other.__class__ is not self.__class__:",
+        "        return NotImplemented",
+    ]
+    for a in attrs:
+        lines += [
+            "    a = self.%s" % (a.name,),
+            "    b = other.%s" % (a.name,),
+            "    if not (a is b or a == b):",
+            "        return op(a, b)",
+        ]
+    lines.append("    return result_if_equal")
+    script = "\n".join(lines)
+    order = _make_method("__attrs_order__", script, unique_filename)
+
+    return _order_methods(order)
+
+
+def _order_methods(order):
+    """
+    Return the ordering methods that compare instances using *order*.
+    """
 
     def __lt__(self, other):
         """
         Automatically created by attrs.
         """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) < attrs_to_tuple(other)
-
-        return NotImplemented
+        return order(self, other, lt, False)
 
     def __le__(self, other):
         """
         Automatically created by attrs.
         """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) <= attrs_to_tuple(other)
-
-        return NotImplemented
+        return order(self, other, le, True)
 
     def __gt__(self, other):
         """
         Automatically created by attrs.
         """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) > attrs_to_tuple(other)
-
-        return NotImplemented
+        return order(self, other, gt, False)
 
     def __ge__(self, other):
         """
         Automatically created by attrs.
         """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) >= attrs_to_tuple(other)
-
-        return NotImplemented
+        return order(self, other, ge, True)
 
     return __lt__, __le__, __gt__, __ge__
 
 
+# All ``__lt__`` methods returned by `_order_methods` share this code.
+_order_lt_code = _order_methods(None)[0].__code__
+
+
+def _ordered_by(cls):
+    """
+    Return the class whose attributes the ordering methods of *cls* compare.
+
+    Return ``None`` if *cls* isn't ordered by methods that ``attrs``
+    generated.
+    """
+    for owner in cls.__mro__:
+        if "__lt__" in owner.__dict__:
+            break
+    else:
+        return None
+
+    lt = owner.__lt__
+    lt = getattr(lt, "__func__", lt)
+    if getattr(lt, "__code__", None) is not _order_lt_code:
+        return None
+
+    return owner
+
+
 def _add_eq(cls, attrs=None):
     """
     Add equality methods to *cls* with *attrs*.
@@ -1274,64 +1746,118 @@ def _add_eq(cls, attrs=None):
 
 _already_repring = threading.local()
 
+# Values of these exact types can't refer back to the instance, so __repr__
+# doesn't need its recursion guard if all values are of them.
+_non_recursive_types = frozenset(
+    (bool, bytes, complex, float, int, str, type(u""), type(None))
+)
 
-def _make_repr(attrs, ns):
+
+def _make_repr(cls, attrs, ns):
     """
     Make a repr method that includes relevant *attrs*, adding *ns* to the full
     name.
     """
-
     # Figure out which attributes to include, and which function to use to
     # format them. The a.repr value can be either bool or a custom callable.
+    repr_attrs = [a for a in attrs if a.repr is not False]
     attr_names_with_reprs = tuple(
-        (a.name, repr if a.repr is True else a.repr)
-        for a in attrs
-        if a.repr is not False
+        (a.name, repr if a.repr is True else a.repr) for a in repr_attrs
     )
 
-    def __repr__(self):
-        """
-        Automatically created by attrs.
-        """
-        try:
-            working_set = _already_repring.working_set
-        except AttributeError:
-            working_set = set()
-            _already_repring.working_set = working_set
-
-        if id(self) in working_set:
-            return "..."
-        real_cls = self.__class__
-        if ns is None:
-            qualname = getattr(real_cls, "__qualname__", None)
-            if qualname is not None:
-                class_name = qualname.rsplit(">.", 1)[-1]
-            else:
-                class_name = real_cls.__name__
+    unique_filename = _generate_unique_filename(cls, "repr")
+    globs = {
+        "_already_repring": _already_repring,
+        "_non_recursive_types": _non_recursive_types,
+        "NOTHING": NOTHING,
+    }
+
+    # Subclasses inherit the method, so the class name has to be looked up on
+    # every call.  Stripping the qualified name is only necessary for them.
+    if ns is not None:
+        class_name = "%r + self.__class__.__name__" % (ns + ".",)
+    elif PY2:
+        class_name = "self.__class__.__name__"
+    else:
+        qualname = getattr(cls, "__qualname__", cls.__name__)
+        globs["own_qualname"] = qualname
+        globs["own_name"] = qualname.rsplit(">.", 1)[-1]
+        class_name = "class_name"
+
+    # Attributes that haven't been set (yet) are represented by NOTHING, but
+    # plain attribute access is much faster than getattr() with a default,
+    # so we only fall back to the latter if necessary.  The values are
+    # formatted outside of the try such that an AttributeError raised by the
+    # repr of a value isn't mistaken for a missing attribute.
+    fast = []
+    slow = []
+    fields = []
+    for i, (name, attr_repr) in enumerate(attr_names_with_reprs):
+        fast.append("    value_%d = self.%s" % (i, name))
+        slow.append("    value_%d = getattr(self, %r, NOTHING)" % (i, name))
+        if attr_repr is repr:
+            fmt = "repr(value_%d)"
         else:
-            class_name = ns + "." + real_cls.__name__
-
-        # Since 'self' remains on the stack (i.e.: strongly referenced) for the
-        # duration of this call, it's safe to depend on id(...) stability, and
-        # not need to track the instance and therefore worry about properties
-        # like weakref- or hash-ability.
-        working_set.add(id(self))
-        try:
-            result = [class_name, "("]
-            first = True
-            for name, attr_repr in attr_names_with_reprs:
-                if first:
-                    first = False
-                else:
-                    result.append(", ")
-                result.extend(
-                    (name, "=", attr_repr(getattr(self, name, NOTHING)))
-                )
-            return "".join(result) + ")"
-        finally:
-            working_set.remove(id(self))
+            fmt = "attr_repr_%d(value_%%d)" % (i,)
+            globs["attr_repr_%d" % (i,)] = attr_repr
+        prefix = "%r + " % (("" if i == 0 else ", ") + name + "=",)
+        fields.append(prefix + fmt % (i,))
+
+    lines = ["def __repr__(self):"]
+    if class_name == "class_name":
+        lines += [
+            "    qualname = self.__class__.__qualname__",
+            "    if qualname == own_qualname:",
+            "        class_name = own_name",
+            "    else:",
+            '        class_name = qualname.rsplit(">.", 1)[-1]',
+        ]
+    if not fields:
+        lines.append("    return %s + '()'" % (class_name,))
+    else:
+        ret = ["return (", "    %s + '('" % (class_name,)]
+        ret += ["    + " + field for field in fields]
+        ret += ["    + ')'", ")"]
+        lines += ["    try:"] + ["    " + line for line in fast]
+        lines += ["    except AttributeError:"]
+        lines += ["    " + line for line in slow]
+        # Values of these types can't refer back to us, so there's no need
+        # for the recursion guard.
+        lines += [
+            "    if (",
+            "        "
+            + "\n        and ".join(
+                "value_%d.__class__ in _non_recursive_types" % (i,)
+                for i in range(len(fields))
+            ),
+            "    ):",
+        ]
+        lines += ["        " + line for line in ret]
+        lines += [
+            "    try:",
+            "        working_set = _already_repring.working_set",
+            "    except AttributeError:",
+            "        working_set = set()",
+            "        _already_repring.working_set = working_set",
+            "",
+            "    if id(self) in working_set:",
+            '        return "..."',
+            "",
+            # Since 'self' remains on the stack (i.e.: strongly referenced)
+            # for the duration of this call, it's safe to depend on id(...)
+            # stability, and not need to track the instance and therefore
+            # worry about properties like weakref- or hash-ability.
+            "    working_set.add(id(self))",
+            "    try:",
+        ]
+        lines += ["        " + line for line in ret]
+        lines += [
+            "    finally:",
+            "        working_set.remove(id(self))",
+        ]
+    script = "\n".join(lines)
 
-    return __repr__
+    return _make_method("__repr__", script, unique_filename, globs)
 
 
 def _add_repr(cls, ns=None, attrs=None):
@@ -1341,22 +1867,43 @@ def _add_repr(cls, ns=None, attrs=None):
     if attrs is None:
         attrs = cls.__attrs_attrs__
 
-    cls.__repr__ = _make_repr(attrs, ns)
+    cls.__repr__ = _make_repr(cls, attrs, ns)
     return cls
 
 
 def _make_init(
-    cls, attrs, post_init, frozen, slots, cache_hash, base_attr_map, is_exc
+    cls,
+    attrs,
+    post_init,
+    frozen,
+    slots,
+    cache_hash,
+    base_attr_map,
+    is_exc,
+    eager_hash_type=None,
+    interner=None,
 ):
+    """
+    Return the ``__init__`` for *cls*.
+
+    If *interner* is passed, return a ``__new__`` that initializes the new
+    instance itself and returns ``interner(instance)`` instead.
+    """
+    hash_attrs = _hash_attrs(attrs) if eager_hash_type is not None else None
     attrs = [a for a in attrs if a.init or a.default is not NOTHING]
 
     unique_filename = _generate_unique_filename(cls, "init")
 
     script, globs, annotations = _attrs_to_init_script(
-        attrs, frozen, slots, post_init, cache_hash, base_attr_map, is_exc
+        attrs,
+        frozen,
+        slots,
+        post_init,
+        cache_hash,
+        base_attr_map,
+        is_exc,
+        hash_attrs,
     )
-    locs = {}
-    bytecode = compile(script, unique_filename, "exec")
     attr_dict = dict((a.name, a) for a in attrs)
     globs.update({"NOTHING": NOTHING, "attr_dict": attr_dict})
 
@@ -1365,21 +1912,70 @@ def _make_init(
         # immutability.
         globs["_cached_setattr"] = _obj_setattr
 
-    eval(bytecode, globs, locs)
+    if hash_attrs is not None:
+        globs["type_hash"] = eager_hash_type
+        globs["_CacheHashWrapper"] = _CacheHashWrapper
 
-    # In order of debuggers like PDB being able to step through the code,
-    # we add a fake linecache entry.
-    linecache.cache[unique_filename] = (
-        len(script),
-        None,
-        script.splitlines(True),
-        unique_filename,
-    )
+    if interner is None:
+        name = "__init__"
+    else:
+        name = "__new__"
+        head, body = script.split("\n", 1)
+        script = "\n".join(
+            (
+                head.replace("def __init__(self", "def __new__(_attrs_cls", 1),
+                "    self = _object_new(_attrs_cls)",
+                body.rstrip(),
+                "    return _attrs_intern(self)",
+            )
+        )
+        globs["_object_new"] = object.__new__
+        globs["_attrs_intern"] = interner
+        del annotations["return"]
 
-    __init__ = locs["__init__"]
-    __init__.__annotations__ = annotations
+    method = _make_method(name, script, unique_filename, globs)
+    method.__annotations__ = annotations
 
-    return __init__
+    return method
+
+
+def _make_interner(attrs):
+    """
+    Return a function that returns the canonical instance for the instance it
+    is called with.  Instances are canonical for all instances of the same
+    class whose *attrs* are equal as long as they're alive.
+    """
+    key_names = [a.name for a in attrs if a.eq]
+    if key_names:
+        get_key = attrgetter(*key_names)
+    else:
+
+        def get_key(inst):
+            return ()
+
+    instances = weakref.WeakValueDictionary()
+
+    def intern(inst):
+        try:
+            return instances.setdefault((inst.__class__, get_key(inst)), inst)
+        except TypeError:
+            # Instances with unhashable values can't be interned.
+            return inst
+
+    return intern
+
+
+def _unpickle_interned(cls, state):
+    """
+    Restore an instance of an interning *cls* and intern it.
+    """
+    inst = object.__new__(cls)
+    if isinstance(state, dict):
+        inst.__dict__.update(state)
+    else:
+        inst.__setstate__(state)
+
+    return cls.__attrs_intern__(inst)
 
 
 def fields(cls):
@@ -1467,7 +2063,14 @@ def _is_slot_attr(a_name, base_attr_map):
 
 
 def _attrs_to_init_script(
-    attrs, frozen, slots, post_init, cache_hash, base_attr_map, is_exc
+    attrs,
+    frozen,
+    slots,
+    post_init,
+    cache_hash,
+    base_attr_map,
+    is_exc,
+    hash_attrs=None,
 ):
     """
     Return a script of an initializer for *attrs* and a dict of globals.
@@ -1476,6 +2079,10 @@ def _attrs_to_init_script(
 
     If *frozen* is True, we cannot set the attributes directly so we use
     a cached ``object.__setattr__``.
+
+    If *hash_attrs* is not None, the hash code of those attributes is computed
+    and cached at the end.  The script expects ``type_hash`` and
+    ``_CacheHashWrapper`` among its globals then.
     """
     lines = []
     any_slot_ancestors = any(
@@ -1714,7 +2321,13 @@ def _attrs_to_init_script(
                 init_hash_cache = "_inst_dict['%s'] = %s"
         else:
             init_hash_cache = "self.%s = %s"
-        lines.append(init_hash_cache % (_hash_cache_field, "None"))
+        if hash_attrs is None:
+            hash_code = "None"
+        else:
+            hash_code = "_CacheHashWrapper(hash((type_hash, %s)))" % (
+                "".join("self.%s, " % (a.name,) for a in hash_attrs),
+            )
+        lines.append(init_hash_cache % (_hash_cache_field, hash_code))
 
     # For exceptions we rely on BaseException.__init__ for proper
     # initialization.
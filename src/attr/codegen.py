@@ -0,0 +1,140 @@
+"""
+Ahead-of-time compilation of the methods that ``attrs`` generates.
+
+Run ``python -m attr.codegen mypkg.models -o mypkg/_attrs_models.py`` to
+write a plain Python module that contains the methods of all ``attrs``
+classes in ``mypkg.models``.  If that module is imported before
+``mypkg.models``, ``attrs`` uses its methods instead of compiling them and
+the usual ``.pyc`` caching applies.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import importlib
+import sys
+
+from . import _make
+
+
+_HEADER = """\
+# Generated by attr.codegen from {modules}.  Do not edit.
+#
+# Import this module before the modules above to have attrs use the methods
+# defined here instead of compiling them.
+
+from attr.codegen import register
+
+"""
+
+_FACTORY = """
+def {factory}():
+{body}
+    return {name}
+
+"""
+
+
+def generate(module_names):
+    """
+    Import the modules called *module_names* and return the source code of a
+    module that contains the methods that ``attrs`` generated for them.
+
+    The modules must not have been imported before.
+
+    :param module_names: Names of the modules to import, e.g.
+        ``["mypkg.models"]``.
+    :type module_names: list of str
+
+    :rtype: str
+
+    .. versionadded:: 20.1.0
+    """
+    scripts = {}
+    outer = _make._script_recorder
+    _make._script_recorder = scripts
+    try:
+        for module_name in module_names:
+            _build_lazy_methods(importlib.import_module(module_name))
+    finally:
+        _make._script_recorder = outer
+
+    parts = [_HEADER.format(modules=", ".join(module_names))]
+    factories = []
+    for i, script in enumerate(sorted(scripts)):
+        factory = "__attrs_{0}".format(i)
+        parts.append(
+            _FACTORY.format(
+                factory=factory,
+                body="\n".join(
+                    "    " + line if line else line
+                    for line in script.splitlines()
+                ),
+                name=scripts[script],
+            )
+        )
+        factories.append("    ({0!r}, {1}),\n".format(script, factory))
+    parts.append("register([\n" + "".join(factories) + "])\n")
+
+    return "".join(parts)
+
+
+def _build_lazy_methods(module):
+    """
+    Make sure the methods of lazy ``attrs`` classes in *module* are built.
+    """
+    for obj in list(vars(module).values()):
+        if (
+            isinstance(obj, type)
+            and getattr(obj, "__module__", None) == module.__name__
+            and getattr(obj, "__attrs_attrs__", None) is not None
+        ):
+            for name, value in list(vars(obj).items()):
+                if isinstance(value, _make._LazyMethod):
+                    getattr(obj, name)
+
+
+def register(factories):
+    """
+    Make ``attrs`` use the ahead-of-time compiled *factories* instead of
+    compiling the methods they return.
+
+    This is called by the modules that `generate` writes.
+
+    :param factories: ``(script, factory)`` pairs where *factory* is a
+        function that returns the method defined by *script*.
+
+    .. versionadded:: 20.1.0
+    """
+    for script, factory in factories:
+        _make._precompiled[script] = factory.__code__
+
+
+def main(argv=None):
+    """
+    Entry point of ``python -m attr.codegen``.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m attr.codegen",
+        description="Write a module containing the methods that attrs "
+        "generates for the classes in the given modules.",
+    )
+    parser.add_argument(
+        "modules", metavar="module", nargs="+", help="modules to import"
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write to instead of standard output"
+    )
+    args = parser.parse_args(argv)
+
+    source = generate(args.modules)
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w") as f:
+            f.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+def generate(module_names: Iterable[str]) -> str: ...
+def register(factories: Iterable[Tuple[str, Callable[[], Any]]]) -> None: ...
+def main(argv: Optional[List[str]] = ...) -> None: ...
@@ -297,3 +297,59 @@ class TestAnnotations:
         @attr.s(auto_attribs=True)
         class C:
             x: typing.Any = NonComparable()
+
+
+@attr.s(auto_attribs=True)
+class _Item:
+    name: str
+    qty: int = 1
+
+
+@attr.s(auto_attribs=True)
+class _Order:
+    first: _Item
+    maybe: typing.Optional[_Item] = None
+    items: typing.List[_Item] = attr.Factory(list)
+    by_name: typing.Dict[str, _Item] = attr.Factory(dict)
+    pair: typing.Tuple[_Item, ...] = ()
+    seq: typing.Sequence[_Item] = ()
+    either: typing.Union[_Item, int] = 0
+    fixed: typing.Tuple[_Item, _Item] = None
+    later: "_Item" = None
+
+
+class TestFromDict:
+    """
+    Tests for `attr.from_dict` with types from annotations.
+    """
+
+    def test_roundtrip(self):
+        """
+        Dicts are structured according to generic types and Optional.
+        """
+        item = _Item("a", 2)
+        order = _Order(item, item, [item], {"a": item}, (item, item), [item])
+
+        assert order == attr.from_dict(_Order, attr.asdict(order))
+
+    def test_missing_optional(self):
+        """
+        None and missing values stay as they are.
+        """
+        order = attr.from_dict(_Order, {"first": {"name": "a"}, "maybe": None})
+
+        assert _Order(_Item("a")) == order
+
+    def test_ambiguous(self):
+        """
+        Ambiguous types and strings are ignored.
+        """
+        d = {"name": "a", "qty": 1}
+
+        order = attr.from_dict(
+            _Order, {"first": d, "either": d, "fixed": [d, d], "later": d},
+        )
+
+        assert d == order.either
+        assert [d, d] == order.fixed
+        assert d == order.later
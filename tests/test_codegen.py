@@ -0,0 +1,144 @@
+"""
+Tests for `attr.codegen`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import inspect
+import sys
+
+import pytest
+
+from attr import _make, codegen
+from attr._compat import ordered_dict
+
+
+MODELS = """\
+import attr
+
+
+@attr.s(hash=True, frozen=True, slots=True)
+class C(object):
+    x = attr.ib()
+    y = attr.ib(default=2, converter=int)
+
+
+@attr.s(lazy=True)
+class L(object):
+    a = attr.ib(factory=list)
+"""
+
+
+@pytest.fixture(name="models")
+def _models(tmpdir, monkeypatch):
+    """
+    Return the name of a fresh module containing `MODELS` that can be
+    imported as often as needed.
+    """
+    tmpdir.join("cg_models.py").write(MODELS)
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.setattr(_make, "_precompiled", {})
+    monkeypatch.delitem(sys.modules, "cg_models", raising=False)
+    yield "cg_models"
+    sys.modules.pop("cg_models", None)
+    sys.modules.pop("cg_generated", None)
+
+
+def _forbid_compile(monkeypatch):
+    def compile(*args, **kw):
+        raise AssertionError("compile() called despite precompiled code.")
+
+    monkeypatch.setattr(_make, "compile", compile, raising=False)
+    monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+
+
+class TestGenerate(object):
+    def test_generate(self, models, tmpdir, monkeypatch):
+        """
+        The generated module makes attrs use precompiled methods that behave
+        like the compiled ones.
+        """
+        source = codegen.generate([models])
+
+        assert "    def __hash__(self):\n" in source
+        assert "    def __init__(self, a=NOTHING):\n" in source
+
+        gen_dir = tmpdir.mkdir("gen")
+        gen_dir.join("cg_generated.py").write(source)
+        monkeypatch.syspath_prepend(str(gen_dir))
+        del sys.modules[models]
+        _forbid_compile(monkeypatch)
+        __import__("cg_generated")
+        m = __import__(models)
+
+        assert "C(x=1, y=2)" == repr(m.C(1, "2"))
+        assert m.C(1) == m.C(1, 2)
+        assert hash(m.C(1)) == hash(m.C(1, 2))
+        assert [] == m.L().a
+        assert "cg_generated.py" == (
+            m.C.__init__.__code__.co_filename.rsplit("/", 1)[-1]
+        )
+        assert (
+            inspect.getsource(m.C.__init__)
+            .lstrip()
+            .startswith("def __init__(self, x, y=")
+        )
+        assert m.C.__init__.__name__ == "__init__"
+
+    def test_generate_restores_recorder(self, models):
+        """
+        No scripts are recorded after `generate` returns, even if it failed.
+        """
+        codegen.generate([models])
+
+        assert None is _make._script_recorder
+
+        with pytest.raises(ImportError):
+            codegen.generate(["cg_does_not_exist"])
+
+        assert None is _make._script_recorder
+
+
+class TestRegister(object):
+    def test_only_identical_scripts(self, monkeypatch):
+        """
+        Only methods whose script is identical to a registered one are taken
+        from the factories.
+        """
+        monkeypatch.setattr(_make, "_precompiled", {})
+
+        def factory():
+            def __init__(self, x):
+                self.x = "precompiled"
+
+            return __init__
+
+        script = "def __init__(self, x):\n    self.x = x\n"
+        codegen.register([(script, factory)])
+        C = _make.make_class("C", ["x"])
+        D = _make.make_class("D", ["y"])
+
+        assert "precompiled" == C(1).x
+        assert 1 == D(1).y
+
+
+class TestMain(object):
+    def test_stdout(self, models, capsys):
+        """
+        Without -o, the module is written to standard output.
+        """
+        codegen.main([models])
+
+        out, _ = capsys.readouterr()
+
+        assert out.startswith("# Generated by attr.codegen from cg_models.")
+
+    def test_output(self, models, tmpdir):
+        """
+        With -o, the module is written to the file given.
+        """
+        path = tmpdir.join("out.py")
+
+        codegen.main([models, "-o", str(path)])
+
+        assert "\nregister([\n" in path.read()
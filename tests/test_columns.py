@@ -0,0 +1,316 @@
+"""
+Tests for `attr._columns`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import copy
+
+from array import array
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+import attr
+
+from attr import Table, column_store, to_columns
+from attr.exceptions import NotAnAttrsClassError
+
+
+@attr.s
+class Point(object):
+    x = attr.ib(type=int)
+    y = attr.ib(type=float)
+    label = attr.ib(default="")
+
+
+class TestColumnStore(object):
+    """
+    Tests for `column_store` and `Table`.
+    """
+
+    def test_empty(self):
+        """
+        Tables are empty unless instances are passed.
+        """
+        t = column_store(Point)
+
+        assert isinstance(t, Table)
+        assert Point is t.cls
+        assert 0 == len(t)
+        assert [] == list(t)
+        assert "<Table(cls=Point, rows=0)>" == repr(t)
+
+    def test_columns(self):
+        """
+        Columns of int and float attributes are arrays, the others are lists.
+        """
+        t = column_store(Point, [Point(1, 2.0), Point(3, 4.5, "b")])
+
+        assert 2 == len(t)
+        assert ["x", "y", "label"] == list(t.columns)
+        assert array("q", [1, 3]) == t.columns["x"]
+        assert array("d", [2.0, 4.5]) == t.columns["y"]
+        assert ["", "b"] == t.columns["label"]
+
+    @pytest.mark.parametrize("value", [2, True, None, 2 ** 64, "2"], ids=repr)
+    def test_fallback_to_list(self, value):
+        """
+        Columns become lists once they get a value that isn't exactly of the
+        attribute's type or doesn't fit, and values come back unchanged.
+        """
+        t = column_store(Point, [Point(1, 2.5)])
+
+        t.append(Point(1, value))
+        t.append(Point(1, 3.5))
+
+        assert array("q", [1, 1, 1]) == t.columns["x"]
+        assert [2.5, value, 3.5] == t.columns["y"]
+        assert value is t[1].y
+
+    def test_unhashable_type(self):
+        """
+        Attributes may have unhashable types.
+        """
+        C = attr.make_class("C", {"x": attr.ib(type=["a"])})
+
+        t = column_store(C, [C(1)])
+
+        assert [1] == t.columns["x"]
+
+    def test_int_overflow(self):
+        """
+        Int columns become lists once a value doesn't fit into 64 bits.
+        """
+        t = column_store(Point, [Point(1, 2.0), Point(2 ** 63, 2.0)])
+
+        assert [1, 2 ** 63] == t.columns["x"]
+
+    def test_rows(self):
+        """
+        Rows are views whose attributes are the stored values.
+        """
+        t = column_store(Point, [Point(1, 2.0), Point(3, 4.5, "b")])
+
+        r = t[1]
+
+        assert (3, 4.5, "b") == (r.x, r.y, r.label)
+        assert 3 == t[-1].x
+        assert [1, 3] == [row.x for row in t]
+        assert "<Point row 1: x=3, y=4.5, label='b'>" == repr(r)
+
+    def test_row_views(self):
+        """
+        Rows reflect the columns even if a column is replaced by a list.
+        """
+        t = column_store(Point, [Point(1, 2.0)])
+        r = t[0]
+
+        t.append(Point(1, None))
+
+        assert 2.0 == r.y
+
+    def test_row_missing_attribute(self):
+        """
+        Rows raise AttributeError for names that aren't attributes.
+        """
+        t = column_store(Point, [Point(1, 2.0)])
+
+        with pytest.raises(AttributeError) as e:
+            t[0].z
+
+        assert ("'Point' row has no attribute 'z'",) == e.value.args
+
+    def test_row_copy(self):
+        """
+        Rows can be copied.
+        """
+        t = column_store(Point, [Point(1, 2.0)])
+
+        assert 1 == copy.copy(t[0]).x
+
+    @pytest.mark.parametrize("index", [1, -2, 2 ** 70])
+    def test_index_out_of_range(self, index):
+        """
+        Indexes beyond the table raise IndexError.
+        """
+        t = column_store(Point, [Point(1, 2.0)])
+
+        with pytest.raises(IndexError):
+            t[index]
+        with pytest.raises(IndexError):
+            t.instance(index)
+
+    def test_no_slicing(self):
+        """
+        Tables can only be indexed by integers.
+        """
+        t = column_store(Point, [Point(1, 2.0)])
+
+        with pytest.raises(TypeError):
+            t[:1]
+
+    def test_instance(self):
+        """
+        Instances are created from the stored values like `evolve` does.
+        """
+
+        @attr.s
+        class C(object):
+            _private = attr.ib(converter=int)
+            derived = attr.ib(init=False)
+
+            def __attrs_post_init__(self):
+                self.derived = self._private * 2
+
+        t = column_store(C, [C("1"), C(2)])
+
+        assert C(1) == t.instance(0)
+        assert [C(1), C(2)] == list(t.instances())
+
+    def test_exact_class(self):
+        """
+        Only instances of exactly the table's class can be stored and nothing
+        is stored if one is rejected.
+        """
+
+        @attr.s
+        class SubPoint(Point):
+            z = attr.ib(default=0)
+
+        t = column_store(Point)
+
+        with pytest.raises(TypeError) as e:
+            t.append(SubPoint(1, 2.0))
+
+        assert (
+            "Can only store instances of Point, got SubPoint.",
+        ) == e.value.args
+        assert 0 == len(t)
+
+    def test_uninitialized(self):
+        """
+        If an attribute can't be read, no column is changed.
+        """
+
+        @attr.s(slots=True)
+        class C(object):
+            x = attr.ib(type=int)
+            y = attr.ib()
+
+        i = C(1, 2)
+        del i.y
+        t = column_store(C)
+
+        with pytest.raises(AttributeError):
+            t.append(i)
+
+        assert 0 == len(t)
+        assert 0 == len(t.columns["x"])
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            column_store(object)
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(),
+                st.floats(allow_nan=False) | st.integers(),
+                st.text(),
+            )
+        )
+    )
+    def test_round_trip(self, values):
+        """
+        Materialized instances equal the stored ones.
+        """
+        instances = [Point(*v) for v in values]
+
+        t = column_store(Point, instances)
+
+        assert instances == list(t.instances())
+
+
+@attr.s(frozen=True, slots=True, hash=True, cache_hash=True)
+class Full(object):
+    x = attr.ib(converter=int)
+    _y = attr.ib(validator=attr.validators.instance_of(str), default="a")
+    z = attr.ib(factory=list)
+    w = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        object.__setattr__(self, "w", self.x * 2)
+
+
+class TestToColumns(object):
+    """
+    Tests for `to_columns`.
+    """
+
+    def test_columns(self):
+        """
+        Returns a list of values per attribute, in the order of the
+        attributes and keyed by their names.
+        """
+        i = Full(1, "b", [1])
+
+        columns = to_columns(iter([i, Full(2)]), Full)
+
+        assert ["x", "_y", "z", "w"] == list(columns)
+        assert {
+            "x": [1, 2],
+            "_y": ["b", "a"],
+            "z": [[1], []],
+            "w": [2, 4],
+        } == columns
+        assert i.z is columns["z"][0]
+
+    def test_empty(self):
+        """
+        No instances, empty columns; no attributes, no columns.
+        """
+        C = attr.make_class("C", [])
+
+        assert {"x": [], "y": [], "label": []} == to_columns([], Point)
+        assert {} == to_columns([C()], C)
+
+    def test_round_trip(self):
+        """
+        The columns of instances create equal instances.
+        """
+        instances = [Point(1, 2.0, "a"), Point(3, 4.0, "b")]
+
+        columns = to_columns(instances, Point)
+
+        assert instances == [Point(*row) for row in zip(*columns.values())]
+
+    def test_cached(self):
+        """
+        The extractor is created once per class; subclasses get their own.
+        """
+
+        @attr.s
+        class Sub(Point):
+            z = attr.ib(default=0)
+
+        to_columns([], Point)
+        extract = Point.__dict__["__attrs_to_columns__"][Point]
+        to_columns([], Point)
+
+        assert extract is Point.__dict__["__attrs_to_columns__"][Point]
+        assert {"x": [1], "y": [2.0], "label": [""], "z": [3]} == to_columns(
+            [Sub(1, 2.0, z=3)], Sub
+        )
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            to_columns([], object)
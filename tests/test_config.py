@@ -41,3 +41,72 @@ class TestConfig(object):
         with pytest.raises(TypeError) as e:
             _config.set_run_validators("False")
         assert "'run' must be bool." == e.value.args[0]
+
+    def test_code_cache_dir_default(self):
+        """
+        The code cache is disabled by default.
+        """
+        assert None is _config._code_cache_dir
+
+    def test_set_get_code_cache_dir(self):
+        """
+        Sets and returns `_code_cache_dir`.
+        """
+        _config.set_code_cache_dir("/tmp/attrs")
+        assert "/tmp/attrs" == _config.get_code_cache_dir()
+        _config.set_code_cache_dir(None)
+        assert None is _config.get_code_cache_dir()
+
+    def test_code_cache_dir_wrong_type(self):
+        """
+        Passing anything else than a string or None raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_code_cache_dir(42)
+        assert "'path' must be a str or None." == e.value.args[0]
+
+    def test_build_observer_default(self):
+        """
+        Nobody observes builds by default.
+        """
+        assert None is _config._build_observer
+
+    def test_set_get_build_observer(self):
+        """
+        Sets and returns `_build_observer`.
+        """
+        _config.set_build_observer(print)
+        assert print is _config.get_build_observer()
+        _config.set_build_observer(None)
+        assert None is _config.get_build_observer()
+
+    def test_build_observer_wrong_type(self):
+        """
+        Passing anything else than a callable or None raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_build_observer(42)
+        assert "'observer' must be callable or None." == e.value.args[0]
+
+    def test_populate_linecache_default(self):
+        """
+        Populate linecache by default.
+        """
+        assert True is _config._populate_linecache
+
+    def test_set_get_populate_linecache(self):
+        """
+        Sets and returns `_populate_linecache`.
+        """
+        _config.set_populate_linecache(False)
+        assert False is _config.get_populate_linecache()
+        _config.set_populate_linecache(True)
+        assert True is _config.get_populate_linecache()
+
+    def test_populate_linecache_wrong_type(self):
+        """
+        Passing anything else than a boolean raises TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            _config.set_populate_linecache("False")
+        assert "'populate' must be bool." == e.value.args[0]
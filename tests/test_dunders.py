@@ -5,7 +5,10 @@ Tests for dunder methods from `attrib._make`.
 from __future__ import absolute_import, division, print_function
 
 import copy
+import gc
+import inspect
 import pickle
+import weakref
 
 import pytest
 
@@ -14,6 +17,8 @@ from hypothesis.strategies import booleans
 
 import attr
 
+from attr import _make
+from attr._compat import PY2, ordered_dict
 from attr._make import (
     NOTHING,
     Factory,
@@ -125,6 +130,47 @@ class TestEqOrder(object):
         assert cls(1, 2) != NotEqC()
         assert not (cls(1, 2) == NotEqC())
 
+    @pytest.mark.parametrize("cls", [EqC, EqCSlots])
+    def test_equal_like_tuples(self, cls):
+        """
+        Attribute values are compared like tuple items: identical values are
+        equal even if they aren't equal to themselves.
+        """
+        nan = float("nan")
+
+        assert cls(nan, 1) == cls(nan, 1)
+        assert cls(float("nan"), 1) != cls(float("nan"), 1)
+        assert cls(1, 2) == cls(1.0, 2.0)
+
+    @pytest.mark.parametrize("cls", [EqC, EqCSlots])
+    def test_equal_identical(self, cls):
+        """
+        An instance is equal to itself, whatever its values are.
+        """
+        i = cls(float("nan"), float("nan"))
+
+        assert i == i
+        assert not (i != i)
+
+    def test_short_circuit(self):
+        """
+        Comparing stops at the first attribute that differs and the result is
+        always a bool.
+        """
+
+        class Unequal(object):
+            def __eq__(self, other):
+                return 0
+
+        class Boom(object):
+            def __eq__(self, other):
+                raise AssertionError("Compared too much.")
+
+        C = make_class("C", ["a", "b"])
+
+        assert False is (C(Unequal(), Boom()) == C(Unequal(), Boom()))
+        assert True is (C(1, 2) == C(1, 2))
+
     @pytest.mark.parametrize("cls", [OrderC, OrderCSlots])
     def test_lt(self, cls):
         """
@@ -281,6 +327,96 @@ class TestAddRepr(object):
 
         assert "C(a=NOTHING)" == repr(C())
 
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_repr_uninitialized_member_among_others(self, slots):
+        """
+        Unset attributes don't prevent the others from being represented.
+        """
+        C = make_class(
+            "C",
+            {"a": attr.ib(), "b": attr.ib(init=False), "c": attr.ib(repr=str)},
+            slots=slots,
+        )
+
+        assert "C(a=1, b=NOTHING, c=x)" == repr(C(1, "x"))
+
+    def test_repr_raises_attribute_error(self):
+        """
+        An AttributeError raised while formatting a value is passed on and
+        the value is formatted only once.
+        """
+        calls = []
+
+        class Broken(object):
+            def __repr__(self):
+                calls.append(self)
+                raise AttributeError("broken")
+
+        C = make_class("C", ["a", "b"])
+
+        with pytest.raises(AttributeError, match="broken"):
+            repr(C(1, Broken()))
+
+        assert 1 == len(calls)
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_subclass(self, slots):
+        """
+        Subclasses that inherit the repr use their own name.
+        """
+        C = make_class("C", ["a"], slots=slots)
+
+        class Sub(C):
+            pass
+
+        assert "C(a=1)" == repr(C(1))
+        assert "Sub(a=1)" == repr(Sub(1))
+
+    def test_ns(self):
+        """
+        The name of subclasses is also prefixed by *repr_ns*.
+        """
+        C = make_class("C", ["a"], repr_ns="ns")
+
+        class Sub(C):
+            pass
+
+        assert "ns.C(a=1)" == repr(C(1))
+        assert "ns.Sub(a=1)" == repr(Sub(1))
+
+    @pytest.mark.parametrize("value", [1, "x", u"x", b"x", 1.0, True, None])
+    def test_recursion_guard_skipped(self, value, monkeypatch):
+        """
+        The recursion guard isn't used if all values can't contain other
+        objects.
+        """
+        monkeypatch.setattr(_make, "_already_repring", None)
+        C = make_class("C", ["a", "b"])
+
+        assert "C(a=1, b=%r)" % (value,) == repr(C(1, value))
+
+    @pytest.mark.parametrize("type_", [int, str, None, ["a"]])
+    def test_recursion_guard_ignores_types(self, type_):
+        """
+        Whether the recursion guard is used depends on the values, not on
+        the annotated types.
+        """
+        C = make_class(
+            "C", {"a": attr.ib(type=type_), "b": attr.ib(default=0)}
+        )
+        c = C(1)
+        c.a = c
+
+        assert "C(a=..., b=0)" == repr(c)
+
+    def test_no_attributes(self):
+        """
+        Classes without attributes to represent get empty parentheses.
+        """
+        C = make_class("C", {"a": attr.ib(repr=False)})
+
+        assert "C()" == repr(C(1))
+
     @given(add_str=booleans(), slots=booleans())
     def test_str(self, add_str, slots):
         """
@@ -536,24 +672,109 @@ class TestAddHash(object):
 
     def test_caching_and_custom_setstate(self):
         """
-        The combination of a custom __setstate__ and cache_hash=True is caught
-        with a helpful message.
+        Hash caching works with a custom __setstate__ since the cache doesn't
+        need one to be cleared.
+        """
+        original = HashCacheSerializationTestCustomSetState()
+        original_hash = hash(original)
+
+        round_tripped = pickle.loads(pickle.dumps(original))
+
+        assert round_tripped.restored
+        assert "foo" == round_tripped.foo_string
+        assert None is round_tripped._attrs_cached_hash
+        assert original_hash == hash(round_tripped)
 
-        This is needed because we handle clearing the cache after
-        deserialization with a custom __setstate__. It is possible to make both
-        work, but it requires some thought about how to go about it, so it has
-        not yet been implemented.
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_copies_are_complete(self, slots, frozen):
+        """
+        Copies of instances with cached hash codes keep their attributes and
+        compute the hash code again if necessary.
         """
-        with pytest.raises(
-            NotImplementedError,
-            match="Currently you cannot use hash caching if you "
-            "specify your own __setstate__ method.",
-        ):
+        C = make_class(
+            "C", ["a"], hash=True, slots=slots, frozen=frozen, cache_hash=True
+        )
+        i = C(1)
+        hash(i)
 
-            @attr.attrs(hash=True, cache_hash=True)
-            class NoCacheHashAndCustomSetState(object):
-                def __setstate__(self, state):
-                    pass
+        deep_copy = copy.deepcopy(i)
+        evolved = attr.evolve(i, a=2)
+
+        assert 1 == deep_copy.a
+        assert None is deep_copy._attrs_cached_hash
+        assert hash(i) == hash(deep_copy)
+        assert hash(C(2)) == hash(evolved)
+
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_eager(self, slots, frozen):
+        """
+        With eager_hash=True, the hash code is computed at the end of
+        __init__, after __attrs_post_init__.
+        """
+
+        @attr.s(
+            hash=True,
+            slots=slots,
+            frozen=frozen,
+            cache_hash=True,
+            eager_hash=True,
+        )
+        class C(object):
+            a = attr.ib()
+            b = attr.ib(hash=False)
+            c = attr.ib(init=False)
+
+            def __attrs_post_init__(self):
+                object.__setattr__(self, "c", self.a + 1)
+
+        i = C(1, 2)
+
+        assert None is not i._attrs_cached_hash
+        assert hash(i) == i._attrs_cached_hash
+        assert hash(i) == hash(C(1, 3))
+        assert hash(i) != hash(C(2, 2))
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_eager_filename(self, lazy, monkeypatch):
+        """
+        The file name of __hash__ is only generated once.
+        """
+        monkeypatch.setattr(_make, "_unique_filename_counts", {})
+        monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+        C = make_class(
+            "C", ["a"], hash=True, cache_hash=True, eager_hash=True, lazy=lazy,
+        )
+
+        assert "<attrs generated hash tests.test_dunders.C>" == (
+            C.__hash__.__code__.co_filename
+        )
+
+    def test_eager_requires_cache_hash(self):
+        """
+        eager_hash=True without cache_hash=True raises a TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            make_class("C", ["a"], hash=True, eager_hash=True)
+
+        assert (
+            "Invalid value for eager_hash.  To compute hash codes eagerly, "
+            "cache_hash must be True.",
+        ) == e.value.args
+
+    def test_eager_pickle(self):
+        """
+        Unpickled instances compute their hash code lazily and get the same
+        one that __init__ computed.
+        """
+        original = HashCacheSerializationTestEager()
+        original_hash = hash(original)
+
+        round_tripped = pickle.loads(pickle.dumps(original))
+
+        assert None is round_tripped._attrs_cached_hash
+        assert original_hash == hash(round_tripped)
 
 
 # these are for use in TestAddHash.test_cache_hash_serialization
@@ -573,6 +794,20 @@ class HashCacheSerializationTestCachedSlots(object):
     foo_string = attr.ib(default="foo")
 
 
+@attr.attrs(hash=True, cache_hash=True)
+class HashCacheSerializationTestCustomSetState(object):
+    foo_string = attr.ib(default="foo")
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.restored = True
+
+
+@attr.attrs(frozen=True, cache_hash=True, eager_hash=True)
+class HashCacheSerializationTestEager(object):
+    foo_string = attr.ib(default="foo")
+
+
 class TestAddInit(object):
     """
     Tests for `_add_init`.
@@ -751,6 +986,277 @@ class TestAddInit(object):
         assert 42 == i._private
 
 
+# These are for use in TestIntern.test_pickle_and_copy.  They need to be out
+# here so they can be unpickled.
+@attr.s(frozen=True, intern=True)
+class InternTestDict(object):
+    x = attr.ib()
+
+
+@attr.s(frozen=True, slots=True, intern=True)
+class InternTestSlots(object):
+    x = attr.ib()
+
+
+@attr.s(frozen=True, intern=True, cache_hash=True, eager_hash=True)
+class InternTestEager(object):
+    x = attr.ib()
+
+
+class TestIntern(object):
+    """
+    Tests for interning instances.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_equal_instances_are_identical(self, slots):
+        """
+        Instantiating returns the existing instance if an equal one exists.
+        Converters, defaults, and __attrs_post_init__ run before the lookup.
+        """
+
+        @attr.s(frozen=True, slots=slots, intern=True)
+        class C(object):
+            x = attr.ib(converter=int)
+            y = attr.ib(default=2)
+            z = attr.ib(init=False)
+
+            def __attrs_post_init__(self):
+                object.__setattr__(self, "z", self.x + self.y)
+
+        i = C(1)
+
+        assert i is C("1")
+        assert i is C(1, y=2)
+        assert 3 == i.z
+        assert i is not C(1, 3)
+        assert (1, 3, 4) == attr.astuple(C(1, 3))
+
+    def test_validators(self):
+        """
+        Validators run on every instantiation.
+        """
+        C = make_class(
+            "C",
+            {"x": attr.ib(validator=instance_of(int))},
+            frozen=True,
+            intern=True,
+        )
+        C(1)
+
+        with pytest.raises(TypeError):
+            C("1")
+
+    def test_eq_false_ignored(self):
+        """
+        Attributes with eq=False aren't part of the lookup, so the first
+        instance wins.
+        """
+
+        @attr.s(frozen=True, intern=True)
+        class C(object):
+            x = attr.ib()
+            y = attr.ib(eq=False)
+
+        i = C(1, 2)
+
+        assert i is C(1, 3)
+        assert 2 == C(1, 3).y
+
+    def test_classes_separate(self):
+        """
+        Equal instances of different interning classes aren't shared.
+        """
+
+        @attr.s(frozen=True, intern=True)
+        class C(object):
+            x = attr.ib()
+
+        @attr.s(frozen=True, intern=True)
+        class D(C):
+            pass
+
+        assert type(C(1)) is C
+        assert type(D(1)) is D
+        assert C(1) is not D(1)
+
+    def test_no_attributes(self):
+        """
+        Classes without attributes have only one instance.
+        """
+
+        @attr.s(frozen=True, intern=True)
+        class C(object):
+            pass
+
+        assert C() is C()
+
+    def test_unhashable(self):
+        """
+        Instances with unhashable attributes are created as usual.
+        """
+        C = make_class("C", ["x"], frozen=True, intern=True)
+
+        i = C([1])
+
+        assert [1] == i.x
+        assert i is not C([1])
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_weak(self, slots):
+        """
+        Instances that aren't referenced anymore aren't kept alive.
+        """
+        C = make_class("C", ["x"], frozen=True, slots=slots, intern=True)
+        i = C(1)
+        ref = weakref.ref(i)
+
+        del i
+        gc.collect()
+
+        assert None is ref()
+        assert 1 == C(1).x
+
+    @pytest.mark.parametrize(
+        "cls", [InternTestDict, InternTestSlots, InternTestEager]
+    )
+    def test_pickle_and_copy(self, cls):
+        """
+        Copies, deep copies, and unpickled instances are the canonical
+        instance.
+        """
+        i = cls(1)
+
+        assert i is pickle.loads(pickle.dumps(i))
+        assert i is copy.copy(i)
+        assert i is copy.deepcopy(i)
+        assert i is attr.evolve(i, x=1)
+        assert attr.evolve(i, x=2) is cls(2)
+
+    def test_unpickle_without_canonical(self):
+        """
+        An unpickled instance becomes the canonical one if there's none.
+        """
+        data = pickle.dumps(InternTestSlots(42))
+        gc.collect()
+
+        i = pickle.loads(data)
+
+        assert 42 == i.x
+        assert i is InternTestSlots(42)
+
+    @pytest.mark.skipif(PY2, reason="inspect.signature is PY3-only.")
+    def test_signature(self):
+        """
+        Instantiating takes the arguments that __init__ would.
+        """
+        C = make_class(
+            "C",
+            {"x": attr.ib(), "y": attr.ib(default=2)},
+            frozen=True,
+            intern=True,
+        )
+
+        assert "(x, y=2)" == str(inspect.signature(C))
+
+    @pytest.mark.parametrize(
+        "kw",
+        [
+            {"frozen": False},
+            {"frozen": True, "eq": False},
+            {"frozen": True, "init": False},
+        ],
+    )
+    def test_requires_frozen_eq_init(self, kw):
+        """
+        intern=True raises a TypeError if frozen, eq, or init aren't True.
+        """
+        with pytest.raises(TypeError) as e:
+            make_class("C", ["a"], intern=True, **kw)
+
+        assert (
+            "Invalid value for intern.  To intern instances, frozen, eq, and "
+            "init must be True.",
+        ) == e.value.args
+
+    def test_requires_weakref_slot(self):
+        """
+        intern=True raises a TypeError for slotted classes without a weakref
+        slot.
+        """
+        with pytest.raises(TypeError) as e:
+            make_class(
+                "C",
+                ["a"],
+                intern=True,
+                frozen=True,
+                slots=True,
+                weakref_slot=False,
+            )
+
+        assert (
+            "Invalid value for intern.  To intern instances of slotted "
+            "classes, weakref_slot must be True.",
+        ) == e.value.args
+
+    def test_no_exceptions(self):
+        """
+        intern=True raises a TypeError for exceptions with auto_exc=True.
+        """
+        with pytest.raises(TypeError) as e:
+            make_class(
+                "E",
+                ["a"],
+                bases=(Exception,),
+                intern=True,
+                frozen=True,
+                auto_exc=True,
+            )
+
+        assert (
+            "Invalid value for intern.  Exceptions can't be interned.",
+        ) == e.value.args
+
+    def test_subclasses_must_intern(self):
+        """
+        Subclasses of interning classes raise a TypeError unless they're
+        interning, too.
+        """
+        Base = make_class("Base", ["x"], intern=True, frozen=True)
+
+        with pytest.raises(TypeError) as e:
+            make_class("Sub", ["y"], bases=(Base,), frozen=True)
+
+        assert (
+            "Invalid value for intern.  Subclasses of interning classes must "
+            "be interning, too.",
+        ) == e.value.args
+
+        Sub = make_class("Sub", ["y"], bases=(Base,), intern=True, frozen=True)
+
+        assert Sub(1, 2) is Sub(1, 2)
+        assert Sub(1, 2) is not Base(1)
+
+    def test_own_reduce(self):
+        """
+        intern=True raises a NotImplementedError if the class defines its own
+        __reduce__ because it would be overwritten.
+        """
+        with pytest.raises(NotImplementedError) as e:
+
+            @attr.s(frozen=True, intern=True)
+            class C(object):
+                x = attr.ib()
+
+                def __reduce__(self):
+                    pass
+
+        assert (
+            "Currently you cannot intern instances if you specify your own "
+            "__reduce__ method.",
+        ) == e.value.args
+
+
 class TestNothing(object):
     """
     Tests for `_Nothing`.
@@ -4,6 +4,9 @@ Tests for `attr._funcs`.
 
 from __future__ import absolute_import, division, print_function
 
+import json
+import sys
+
 from collections import OrderedDict
 
 import pytest
@@ -13,14 +16,37 @@ from hypothesis import strategies as st
 
 import attr
 
-from attr import asdict, assoc, astuple, evolve, fields, has
-from attr._compat import TYPE, Mapping, Sequence, ordered_dict
-from attr.exceptions import AttrsAttributeNotFoundError
+from attr import (
+    asdict,
+    assoc,
+    astuple,
+    evolve,
+    fields,
+    from_dict,
+    has,
+    iter_json,
+    json_encoder,
+    sort_instances,
+    sort_key,
+    tuple_getter,
+)
+from attr._compat import (
+    TYPE,
+    Mapping,
+    RecursionError,
+    Sequence,
+    ordered_dict,
+)
+from attr._funcs import _asdict_steps, _astuple_steps, _run_steps
+from attr.exceptions import AttrsAttributeNotFoundError, NotAnAttrsClassError
 from attr.validators import instance_of
 
 from .strategies import nested_classes, simple_classes
 
 
+# Deep enough to exceed the recursion limit.
+DEPTH = sys.getrecursionlimit() * 2
+
 MAPPING_TYPES = (dict, OrderedDict)
 SEQUENCE_TYPES = (list, tuple)
 
@@ -185,6 +211,179 @@ class TestAsDict(object):
 
         assert [a.name for a in fields(cls)] == list(dict_instance.keys())
 
+    @given(nested_classes, st.sampled_from(MAPPING_TYPES), st.booleans())
+    def test_specialized_like_generic(self, cls, dict_class, recurse):
+        """
+        Without a filter, the generated function returns the same as the
+        generic loop.
+        """
+        instance = cls()
+
+        assert asdict(
+            instance,
+            recurse=recurse,
+            filter=lambda a, v: True,
+            dict_factory=dict_class,
+        ) == asdict(instance, recurse=recurse, dict_factory=dict_class)
+
+    def test_dict_factory_without_arguments(self, C):
+        """
+        dict_factory is called without arguments and filled.
+        """
+
+        class D(dict):
+            def __init__(self):
+                pass
+
+        d = asdict(C(1, C(2, 3)), dict_factory=D)
+
+        assert D is type(d)
+        assert {"x": 1, "y": {"x": 2, "y": 3}} == d
+
+    def test_type_not_trusted(self):
+        """
+        Values are recursed into even if the type of the attribute claims
+        they're scalars.
+        """
+
+        @attr.s
+        class C(object):
+            x = attr.ib(type=int)
+
+        assert {"x": {"x": (1,)}} == asdict(
+            C(C((1,))), retain_collection_types=True
+        )
+
+    def test_subclass(self, C):
+        """
+        Subclasses get their own specialized function even if their base
+        class has one.
+        """
+
+        @attr.s
+        class D(C):
+            z = attr.ib()
+
+        asdict(C(1, 2))
+
+        assert {"x": 1, "y": 2, "z": 3} == asdict(D(1, 2, 3))
+        assert {"x": 1, "y": 2} == asdict(C(1, 2))
+
+    def test_not_attrs(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            asdict(object())
+
+    def test_deep(self, C):
+        """
+        Instances and collections nested deeper than the recursion limit are
+        converted, too.
+        """
+        inst = C(0, 0)
+        for i in range(1, DEPTH):
+            inst = C(i, [{"k": (inst,)}])
+
+        d = asdict(inst)
+
+        # Comparing the whole result would hit the recursion limit.
+        for i in range(DEPTH - 1, 0, -1):
+            assert i == d["x"]
+            (d,) = d["y"][0]["k"]
+        assert {"x": 0, "y": 0} == d
+
+    @pytest.mark.parametrize("wrap", [lambda i: i, lambda i: [i]])
+    def test_circular(self, C, wrap):
+        """
+        Circular references raise a RecursionError.
+        """
+        inst = C(1, None)
+        inst.y = wrap(inst)
+
+        with pytest.raises(RecursionError) as e:
+            asdict(inst)
+
+        assert (
+            "Circular reference to a C instance detected.",
+        ) == e.value.args
+
+    def test_recursion_error_from_filter(self, C):
+        """
+        A RecursionError that is raised by a filter is passed on without
+        converting again.
+        """
+        calls = []
+
+        def filter(a, v):
+            calls.append(a)
+            raise RecursionError("filter")
+
+        with pytest.raises(RecursionError, match="filter"):
+            asdict(C(C(1, 2), 3), filter=filter)
+
+        assert 1 == len(calls)
+
+    @given(nested_classes, st.sampled_from(MAPPING_TYPES), st.booleans())
+    def test_steps_like_recursive(self, cls, dict_class, retain):
+        """
+        The explicit stack returns the same as recursing.
+        """
+        instance = cls()
+
+        assert asdict(
+            instance, dict_factory=dict_class, retain_collection_types=retain,
+        ) == _run_steps(_asdict_steps(instance, None, dict_class, retain))
+
+    @given(nested_classes, st.sampled_from(MAPPING_TYPES), st.booleans())
+    def test_memo_like_no_memo(self, cls, dict_class, retain):
+        """
+        Memoizing doesn't change the result.
+        """
+        instance = cls()
+
+        assert asdict(
+            instance, dict_factory=dict_class, retain_collection_types=retain
+        ) == asdict(
+            instance,
+            dict_factory=dict_class,
+            retain_collection_types=retain,
+            memo=True,
+        )
+
+    def test_memo_shares(self, C):
+        """
+        Instances and collections that occur more than once are converted
+        once and the result is shared.
+        """
+        shared = C(1, [2])
+        d = asdict(C(shared, [shared, shared.y]), memo=True)
+
+        assert {"x": {"x": 1, "y": [2]}, "y": [{"x": 1, "y": [2]}, [2]]} == d
+        assert d["x"] is d["y"][0]
+        assert d["x"]["y"] is d["y"][1]
+
+    def test_memo_circular(self, C):
+        """
+        With memo, circular references raise a ValueError.
+        """
+        inst = C(1, [])
+        inst.y.append(C(2, inst))
+
+        with pytest.raises(ValueError) as e:
+            asdict(inst, memo=True)
+
+        assert (
+            "Circular reference to a C instance detected.",
+        ) == e.value.args
+
+    def test_memo_not_attrs(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError with memo, too.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            asdict([], memo=True)
+
 
 class TestAsTuple(object):
     """
@@ -330,6 +529,513 @@ class TestAsTuple(object):
 
         assert instance == roundtrip_instance
 
+    @given(
+        nested_classes,
+        st.sampled_from(SEQUENCE_TYPES + (lambda values: ("x", values),)),
+        st.booleans(),
+        st.booleans(),
+    )
+    def test_specialized_like_generic(
+        self, cls, tuple_factory, recurse, retain
+    ):
+        """
+        Without a filter, the generated function returns the same as the
+        generic loop.
+        """
+        instance = cls()
+
+        assert astuple(
+            instance,
+            recurse=recurse,
+            filter=lambda a, v: True,
+            tuple_factory=tuple_factory,
+            retain_collection_types=retain,
+        ) == astuple(
+            instance,
+            recurse=recurse,
+            tuple_factory=tuple_factory,
+            retain_collection_types=retain,
+        )
+
+    def test_subclass(self, C):
+        """
+        Subclasses get their own specialized function even if their base
+        class has one.
+        """
+
+        @attr.s
+        class D(C):
+            z = attr.ib()
+
+        astuple(C(1, 2))
+
+        assert (1, 2, 3) == astuple(D(1, 2, 3))
+        assert (1, 2) == astuple(C(1, 2))
+
+    def test_deep(self, C):
+        """
+        Instances nested deeper than the recursion limit are converted, too.
+        """
+        inst = C(0, 0)
+        for i in range(1, DEPTH):
+            inst = C(i, {"k": inst})
+
+        t = astuple(inst)
+
+        # Comparing the whole result would hit the recursion limit.
+        for i in range(DEPTH - 1, 0, -1):
+            assert i == t[0]
+            t = t[1]["k"]
+        assert (0, 0) == t
+
+    @pytest.mark.parametrize("wrap", [lambda i: i, lambda i: {"k": i}])
+    def test_circular(self, C, wrap):
+        """
+        Circular references raise a RecursionError.
+        """
+        inst = C(1, None)
+        inst.y = wrap(inst)
+
+        with pytest.raises(RecursionError) as e:
+            astuple(inst)
+
+        assert (
+            "Circular reference to a C instance detected.",
+        ) == e.value.args
+
+    def test_recursion_error_from_property(self):
+        """
+        A RecursionError that is raised by a property is passed on without
+        converting again.
+        """
+        calls = []
+
+        @attr.s
+        class C(object):
+            x = attr.ib()
+
+            @property
+            def y(self):
+                calls.append(self)
+                return self.y
+
+        @attr.s
+        class D(object):
+            c = attr.ib()
+
+        with pytest.raises(RecursionError):
+            astuple(D(C(1)), filter=lambda a, v: C(1).y)
+
+        assert 1 < len(calls) <= sys.getrecursionlimit()
+
+    @given(
+        nested_classes,
+        st.sampled_from(SEQUENCE_TYPES),
+        st.booleans(),
+        st.booleans(),
+    )
+    def test_steps_like_recursive(self, cls, tuple_factory, retain, filter):
+        """
+        The explicit stack returns the same as recursing.
+        """
+        instance = cls()
+        filter = (lambda a, v: a.name != "a") if filter else None
+
+        assert astuple(
+            instance,
+            filter=filter,
+            tuple_factory=tuple_factory,
+            retain_collection_types=retain,
+        ) == _run_steps(
+            _astuple_steps(instance, filter, tuple_factory, retain)
+        )
+
+    @given(nested_classes, st.sampled_from(SEQUENCE_TYPES), st.booleans())
+    def test_memo_like_no_memo(self, cls, tuple_factory, retain):
+        """
+        Memoizing doesn't change the result.
+        """
+        instance = cls()
+
+        assert astuple(
+            instance,
+            tuple_factory=tuple_factory,
+            retain_collection_types=retain,
+        ) == astuple(
+            instance,
+            tuple_factory=tuple_factory,
+            retain_collection_types=retain,
+            memo=True,
+        )
+
+    def test_memo_shares(self, C):
+        """
+        Instances that occur more than once are converted once and the
+        result is shared.
+        """
+        shared = C(1, 2)
+        t = astuple(C(shared, [shared]), memo=True)
+
+        assert ((1, 2), [(1, 2)]) == t
+        assert t[0] is t[1][0]
+
+    def test_memo_filter(self, C):
+        """
+        Instances in dicts are converted without the filter, even if they
+        occur elsewhere, too.
+        """
+        shared = C(1, 2)
+
+        assert ((1,), {"k": (1, 2)}) == astuple(
+            C(shared, {"k": shared}), filter=lambda a, v: v != 2, memo=True
+        )
+
+    def test_memo_circular(self, C):
+        """
+        With memo, circular references raise a ValueError.
+        """
+        inst = C(1, None)
+        inst.y = C(2, inst)
+
+        with pytest.raises(ValueError) as e:
+            astuple(inst, memo=True)
+
+        assert (
+            "Circular reference to a C instance detected.",
+        ) == e.value.args
+
+
+class TestTupleGetter(object):
+    """
+    Tests for `tuple_getter`.
+    """
+
+    @pytest.mark.parametrize("names", [[], ["x"], ["x", "_y", "z"]])
+    def test_like_astuple(self, names):
+        """
+        The getter returns the same as a shallow astuple for any number of
+        attributes.
+        """
+        C = attr.make_class("C", names)
+        i = C(*[[n] for n in range(len(names))])
+
+        assert astuple(i, recurse=False) == tuple_getter(C)(i)
+        assert tuple is type(tuple_getter(C)(i))
+
+    def test_cached(self, C):
+        """
+        The getter is created once per class.
+        """
+        assert tuple_getter(C) is tuple_getter(C)
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            tuple_getter(object)
+
+
+class TestIterJson(object):
+    """
+    Tests for `iter_json`.
+    """
+
+    @given(nested_classes)
+    def test_like_json_dumps(self, cls):
+        """
+        The chunks add up to what json.dumps returns for asdict.
+        """
+        instance = cls()
+
+        assert json.dumps(asdict(instance)) == "".join(iter_json(instance))
+
+    def test_values(self, C):
+        """
+        Values are encoded like json.dumps does.
+        """
+        value = [
+            u'\xe9"',
+            1.5,
+            float("nan"),
+            float("-inf"),
+            True,
+            None,
+            (1,),
+            {1: 2.0, None: False, 0.5: "a", "b": [C(1, 2)]},
+        ]
+
+        assert json.dumps(asdict(C(value, set([3])))) == "".join(
+            iter_json(C(value, set([3])))
+        )
+
+    def test_subclasses(self, C):
+        """
+        Subclasses of strings, ints, and floats are encoded as their base
+        types.
+        """
+
+        class S(str):
+            pass
+
+        class Int(int):
+            def __str__(self):
+                return "nope"
+
+        class F(float):
+            pass
+
+        assert '["s", 1, 0.5]' == "".join(iter_json([S("s"), Int(1), F(0.5)]))
+
+    def test_lazy(self, C):
+        """
+        Iterators become arrays and are consumed only as far as the chunks
+        are.
+        """
+        consumed = []
+
+        def gen():
+            for i in range(3):
+                consumed.append(i)
+                yield C(i, "a")
+
+        chunks = iter_json(gen())
+
+        assert '[{"x": 0, "y": "a"}' == next(chunks)
+        assert [0] == consumed
+        assert ', {"x": 1, "y": "a"}, {"x": 2, "y": "a"}]' == "".join(chunks)
+        assert "[]" == "".join(iter_json(iter([])))
+
+    def test_filter(self, C):
+        """
+        The filter drops attributes, also of nested instances.
+        """
+        assert '{"x": {"x": 2}}' == "".join(
+            iter_json(C(C(2, 3), 4), filter=lambda a, v: a.name == "x")
+        )
+
+    def test_default(self, C):
+        """
+        Objects that can't be encoded are passed to default or raise a
+        TypeError.
+        """
+        obj = object()
+
+        assert '{"x": [1], "y": 2}' == "".join(
+            iter_json(C(obj, 2), default=lambda o: [1])
+        )
+        with pytest.raises(TypeError) as e:
+            "".join(iter_json(C(obj, 2)))
+
+        assert (
+            "Object of type object is not JSON serializable",
+        ) == e.value.args
+
+    def test_bad_key(self):
+        """
+        Dict keys that aren't strings, numbers, bools, or None raise a
+        TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            "".join(iter_json({(1,): 2}))
+
+        assert (
+            "keys must be str, int, float, bool or None, not tuple",
+        ) == e.value.args
+
+    def test_circular(self, C):
+        """
+        Circular references raise a ValueError, shared objects don't.
+        """
+        shared = C(1, 2)
+        inst = C(shared, [shared])
+
+        assert '{"x": {"x": 1, "y": 2}, "y": [{"x": 1, "y": 2}]}' == "".join(
+            iter_json(inst)
+        )
+
+        inst.y.append(inst)
+
+        with pytest.raises(ValueError) as e:
+            "".join(iter_json(inst))
+
+        assert ("Circular reference detected",) == e.value.args
+
+
+class TestJsonEncoder(object):
+    """
+    Tests for `json_encoder`.
+    """
+
+    @given(nested_classes)
+    def test_like_json_dumps(self, cls):
+        """
+        The text is what json.dumps returns for asdict.
+        """
+        instance = cls()
+
+        assert json.dumps(asdict(instance)) == json_encoder(cls)(instance)
+
+    def test_values(self, C):
+        """
+        Values of all kinds are encoded like iter_json does.
+        """
+
+        def make():
+            return C(
+                [1, 0.5, float("nan"), u"\xe9", True, None, (C(1, 2),)],
+                {1: {"a": set([1])}, None: iter([1])},
+            )
+
+        assert "".join(iter_json(make())) == json_encoder(C)(make())
+
+    def test_filter(self, C):
+        """
+        The filter drops attributes, also of nested instances, before they
+        are encoded.
+        """
+        encode = json_encoder(C, filter=lambda a, v: type(v) is not object)
+
+        assert '{"x": {"x": 1}, "y": 2}' == encode(C(C(1, object()), 2))
+
+    def test_subclass(self, C):
+        """
+        Subclasses get their own encoder, also when nested.
+        """
+
+        @attr.s
+        class D(C):
+            z = attr.ib()
+
+        assert '{"x": 1, "y": 2}' == json_encoder(C)(C(1, 2))
+        assert '{"x": {"x": 1, "y": 2, "z": 3}, "y": 2}' == json_encoder(C)(
+            C(D(1, 2, 3), 2)
+        )
+
+    def test_no_attributes(self):
+        """
+        Instances without attributes become empty objects.
+        """
+
+        @attr.s
+        class E(object):
+            pass
+
+        assert "{}" == json_encoder(E)(E())
+        assert "{}" == json_encoder(E, filter=lambda a, v: True)(E())
+
+    def test_deep(self, C):
+        """
+        Instances nested deeper than the recursion limit are encoded, too.
+        """
+        inst = C(0, None)
+        for i in range(1, DEPTH):
+            inst = C(i, [inst])
+
+        assert "".join(iter_json(inst)) == json_encoder(C)(inst)
+
+    def test_circular(self, C):
+        """
+        Circular references raise a ValueError.
+        """
+        inst = C(1, [])
+        inst.y.append(inst)
+
+        with pytest.raises(ValueError) as e:
+            json_encoder(C)(inst)
+
+        assert ("Circular reference detected",) == e.value.args
+
+    def test_recursion_error_from_filter(self, C):
+        """
+        A RecursionError that is raised by a filter is passed on without
+        encoding again.
+        """
+        calls = []
+
+        def filter(a, v):
+            calls.append(a)
+            raise RecursionError("filter")
+
+        with pytest.raises(RecursionError, match="filter"):
+            json_encoder(C, filter=filter)(C(1, 2))
+
+        assert 1 == len(calls)
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            json_encoder(object)
+
+
+class TestFromDict(object):
+    """
+    Tests for `from_dict`.
+    """
+
+    @given(simple_classes())
+    def test_roundtrip(self, cls):
+        """
+        Instances are created from what asdict returns.
+        """
+        instance = cls()
+
+        assert instance == from_dict(cls, asdict(instance))
+
+    def test_nested(self, C):
+        """
+        Values of attributes whose type is an attrs class are created from
+        dicts, other values are passed as they are.
+        """
+
+        @attr.s
+        class D(object):
+            c = attr.ib(type=C)
+            d = attr.ib(type=dict)
+
+        inst = D(C(1, {"x": 2}), {"x": 3})
+
+        assert inst == from_dict(D, asdict(inst))
+        assert inst == from_dict(D, {"c": inst.c, "d": {"x": 3}})
+
+    def test_names(self):
+        """
+        Keys are attribute names, that are passed to __init__ without leading
+        underscores.  Missing keys get defaults; other keys are ignored.
+        """
+
+        @attr.s
+        class C(object):
+            _j = attr.ib(kw_only=True)
+            _x = attr.ib()
+            y = attr.ib(default=2)
+            z = attr.ib(factory=list)
+            _k = attr.ib(default=0, kw_only=True)
+            n = attr.ib(init=False, default=5)
+
+        assert C(1, j=3, k=4) == from_dict(
+            C, {"_j": 3, "_x": 1, "_k": 4, "n": 6, "a": 7}
+        )
+        assert [] == from_dict(C, {"_j": 3, "_x": 1}).z
+
+    def test_missing(self, C):
+        """
+        Missing keys of attributes without defaults raise a TypeError.
+        """
+        with pytest.raises(TypeError) as e:
+            from_dict(C, {"x": 1})
+
+        assert ("Missing key 'y' for C.",) == e.value.args
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            from_dict(object, {})
+
 
 class TestHas(object):
     """
@@ -563,3 +1269,123 @@ class TestEvolve(object):
             b = attr.ib(init=False, default=0)
 
         assert evolve(C(1), a=2).a == 2
+
+
+class TestSortKey(object):
+    """
+    Tests for `sort_key`.
+    """
+
+    @given(st.lists(st.tuples(st.integers(0, 3), st.integers(0, 3))))
+    def test_like_order(self, values):
+        """
+        Sorting by the key gives the same result as sorting by the ordering
+        methods.
+        """
+        C = attr.make_class(
+            "C", {"x": attr.ib(), "y": attr.ib(), "z": attr.ib(order=False)}
+        )
+        instances = [C(x, y, i) for i, (x, y) in enumerate(values)]
+
+        assert sorted(instances) == sorted(instances, key=sort_key(C))
+
+    def test_single_attribute_nan(self):
+        """
+        With a single attribute, identical values are equal, like in the
+        ordering methods.
+        """
+        C = attr.make_class("C", ["x"])
+        nan = float("nan")
+        key = sort_key(C)
+
+        assert (C(nan) < C(nan)) == (key(C(nan)) < key(C(nan)))
+        assert (C(nan) <= C(nan)) == (key(C(nan)) <= key(C(nan)))
+
+    def test_no_attributes(self):
+        """
+        If there are no attributes to order by, the order is kept.
+        """
+        C = attr.make_class("C", {"x": attr.ib(order=False)})
+        instances = [C(2), C(1), C(3)]
+
+        assert instances == sorted(instances, key=sort_key(C))
+
+    def test_not_attrs(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            sort_key(object)
+
+    def test_not_ordered(self):
+        """
+        Classes that aren't ordered by attrs raise a TypeError.
+        """
+        C = attr.make_class("C", ["x"], order=False)
+
+        with pytest.raises(TypeError) as e:
+            sort_key(C)
+
+        assert ("C is not ordered by attrs.  Use order=True.",) == (
+            e.value.args
+        )
+
+    def test_inherited_order(self):
+        """
+        Subclasses that inherit the ordering methods are sorted by the
+        attributes the inherited methods compare.
+        """
+        Base = attr.make_class("Base", ["x"])
+        Sub = attr.make_class("Sub", ["y"], bases=(Base,), order=False)
+        instances = [Sub(1, 2), Sub(1, 1), Sub(0, 3)]
+
+        assert sorted(instances) == sorted(instances, key=sort_key(Sub))
+        assert [Sub(0, 3), Sub(1, 2), Sub(1, 1)] == sort_instances(instances)
+
+    def test_lazy(self):
+        """
+        Ordering methods of lazy classes that haven't been generated yet are
+        recognized.
+        """
+        C = attr.make_class("C", ["x"], lazy=True)
+
+        assert [C(1), C(2)] == sorted([C(2), C(1)], key=sort_key(C))
+
+
+class TestSortInstances(object):
+    """
+    Tests for `sort_instances`.
+    """
+
+    def test_sorted(self):
+        """
+        Returns a sorted list; reverse is honored.
+        """
+        C = attr.make_class("C", ["x", "y"])
+        instances = (C(2, 1), C(1, 2), C(1, 1))
+
+        assert [C(1, 1), C(1, 2), C(2, 1)] == sort_instances(instances)
+        assert [C(2, 1), C(1, 2), C(1, 1)] == sort_instances(
+            iter(instances), reverse=True
+        )
+
+    def test_empty(self):
+        """
+        No instances, empty list.
+        """
+        assert [] == sort_instances([])
+
+    def test_mixed_classes(self):
+        """
+        Instances of more than one class raise a TypeError like comparing them
+        does.
+        """
+        C = attr.make_class("C", ["x"])
+        D = attr.make_class("D", ["x"])
+
+        with pytest.raises(TypeError) as e:
+            sort_instances([C(1), D(1)])
+
+        assert ("Can only sort instances of one class, got C, D.",) == (
+            e.value.args
+        )
@@ -8,7 +8,10 @@ import copy
 import gc
 import inspect
 import itertools
+import linecache
+import os
 import sys
+import threading
 
 from operator import attrgetter
 
@@ -19,7 +22,7 @@ from hypothesis.strategies import booleans, integers, lists, sampled_from, text
 
 import attr
 
-from attr import _config
+from attr import _config, _make
 from attr._compat import PY2, ordered_dict
 from attr._make import (
     Attribute,
@@ -27,8 +30,12 @@ from attr._make import (
     _AndValidator,
     _Attributes,
     _ClassBuilder,
+    _compile_script,
     _CountingAttr,
+    _LazyMethod,
     _determine_eq_order,
+    _generate_unique_filename,
+    _make_method,
     _transform_attrs,
     and_,
     fields,
@@ -1337,7 +1344,17 @@ class TestClassBuilder(object):
             pass
 
         b = _ClassBuilder(
-            C, None, True, True, False, False, False, False, False
+            C,
+            None,
+            True,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
         )
 
         assert "<_ClassBuilder(cls=C)>" == repr(b)
@@ -1351,7 +1368,17 @@ class TestClassBuilder(object):
             x = attr.ib()
 
         b = _ClassBuilder(
-            C, None, True, True, False, False, False, False, False
+            C,
+            None,
+            True,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
         )
 
         cls = (
@@ -1419,6 +1446,8 @@ class TestClassBuilder(object):
             is_exc=False,
             kw_only=False,
             cache_hash=False,
+            lazy=False,
+            eager_hash=False,
         )
         b._cls = {}  # no __module__; no __qualname__
 
@@ -1478,6 +1507,212 @@ class TestClassBuilder(object):
         copy.deepcopy(C())
 
 
+@pytest.fixture(name="observed")
+def _observed():
+    """
+    Collect the classes and timings of builds for the duration of a test.
+    """
+    builds = []
+    _config.set_build_observer(
+        lambda cls, timings: builds.append((cls, timings))
+    )
+    yield builds
+    _config.set_build_observer(None)
+
+
+class TestBuildObserver(object):
+    """
+    Tests for observing class builds.
+    """
+
+    @pytest.mark.parametrize(
+        "slots, step",
+        [(True, "create_slots_class"), (False, "patch_original_class")],
+    )
+    def test_timings(self, observed, slots, step):
+        """
+        The observer is called with the final class and the timings of all
+        steps in the order they have been started.
+        """
+
+        @attr.s(slots=slots, hash=True, str=True)
+        class C(object):
+            x = attr.ib()
+
+        ((cls, timings),) = observed
+        steps = [s for s, _ in timings]
+
+        assert C is cls
+        assert [
+            "transform_attrs",
+            "add_repr",
+            "add_eq",
+            "add_order",
+            "add_hash",
+            "add_init",
+            step,
+        ] == [s for s in steps if s != "compile"]
+        assert "compile" == steps[steps.index("add_init") + 1]
+        assert all(seconds >= 0 for _, seconds in timings)
+
+    def test_lazy(self, observed):
+        """
+        Lazily generated methods are not part of the timings.
+        """
+
+        @attr.s(lazy=True)
+        class C(object):
+            x = attr.ib()
+
+        C(1)
+
+        ((_, timings),) = observed
+
+        assert ["transform_attrs", "patch_original_class"] == [
+            s for s, _ in timings
+        ]
+
+    def test_unobserved(self):
+        """
+        If nobody observes, no timings are recorded.
+        """
+        b = _ClassBuilder(
+            object,
+            {},
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+        )
+
+        assert None is b._timings
+
+
+class TestLazy(object):
+    """
+    Tests for classes with lazily generated methods.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_generates_on_first_access(self, slots, frozen):
+        """
+        Methods are placeholders until first accessed, behave like eagerly
+        generated ones, and replace their placeholders.
+        """
+
+        @attr.s(lazy=True, slots=slots, frozen=frozen, hash=True, order=True)
+        class C(object):
+            x = attr.ib()
+            y = attr.ib(default=2)
+
+        for name in ("__init__", "__repr__", "__eq__", "__hash__", "__lt__"):
+            assert isinstance(C.__dict__[name], _LazyMethod)
+
+        i = C(1)
+
+        assert "C(x=1, y=2)" == repr(i)
+        assert C(1, 2) == i
+        assert C(1, 3) != i
+        assert hash(C(1)) == hash(i)
+        assert i < C(2) and i <= C(2) and C(2) > i and C(2) >= i
+        for name in ("__init__", "__repr__", "__eq__", "__hash__", "__lt__"):
+            assert not isinstance(C.__dict__[name], _LazyMethod)
+
+    def test_generates_group_at_once(self):
+        """
+        Methods that are generated together replace their placeholders
+        together.
+        """
+
+        @attr.s(lazy=True)
+        class C(object):
+            x = attr.ib()
+
+        C.__lt__
+
+        for name in ("__lt__", "__le__", "__gt__", "__ge__"):
+            assert not isinstance(C.__dict__[name], _LazyMethod)
+        assert isinstance(C.__dict__["__repr__"], _LazyMethod)
+
+    def test_inherited(self):
+        """
+        Accessing an inherited placeholder generates the method for the class
+        that it has been attached to.
+        """
+
+        @attr.s(lazy=True)
+        class A(object):
+            a = attr.ib()
+
+        class B(A):
+            pass
+
+        assert "B(a=1)" == repr(B(1))
+        assert "A(a=1)" == repr(A(1))
+        assert "__repr__" not in B.__dict__
+        assert not isinstance(A.__dict__["__repr__"], _LazyMethod)
+
+    def test_replaced_placeholder(self):
+        """
+        Placeholders that have been replaced in the meantime are left alone.
+        """
+
+        @attr.s(lazy=True)
+        class C(object):
+            x = attr.ib()
+
+        def __le__(self, other):
+            return 42
+
+        C.__le__ = __le__
+
+        assert C(1) < C(2)
+        assert 42 == (C(1) <= C(2))
+
+    def test_meta_dunders(self):
+        """
+        Lazily generated methods have the same metadata as eager ones.
+        """
+
+        @attr.s(lazy=True)
+        class C(object):
+            def organic(self):
+                pass
+
+        meth = C.__init__
+
+        assert C.organic.__module__ == meth.__module__
+        if not PY2:
+            organic_prefix = C.organic.__qualname__.rsplit(".", 1)[0]
+            assert organic_prefix + ".__init__" == meth.__qualname__
+
+    def test_no_references_to_original(self):
+        """
+        Placeholders of slotted classes don't keep the original class alive.
+        """
+
+        @attr.s(slots=True, lazy=True)
+        class C(object):
+            pass
+
+        @attr.s(slots=True, lazy=True)
+        class C2(C):
+            pass
+
+        gc.collect()
+
+        assert [C2] == C.__subclasses__()
+
+
+_nan = float("nan")
+
+
 class TestMakeOrder:
     """
     Tests for _make_order().
@@ -1527,6 +1762,59 @@ class TestMakeOrder:
             with pytest.raises(TypeError):
                 a > b
 
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ((1, 2), (1, 3)),
+            ((1, 3), (1, 2)),
+            ((1, 2), (1, 2)),
+            ((float("nan"), 1), (float("nan"), 2)),
+            ((_nan, 1), (_nan, 2)),
+            ((1, _nan), (1, _nan)),
+            ((1, _nan), (1, 2.0)),
+            (("a", []), ("a", [1])),
+        ],
+    )
+    def test_like_tuples(self, a, b):
+        """
+        Instances compare like tuples of their values, including the identity
+        shortcut that makes NaN equal to itself.
+        """
+        C = make_class("C", ["x", "y"])
+
+        assert (a < b) == (C(*a) < C(*b))
+        assert (a <= b) == (C(*a) <= C(*b))
+        assert (a > b) == (C(*a) > C(*b))
+        assert (a >= b) == (C(*a) >= C(*b))
+
+    def test_result_not_coerced(self):
+        """
+        The result of comparing the first differing values is returned as
+        is, like tuples do.
+        """
+
+        class V(object):
+            def __eq__(self, other):
+                return False
+
+            def __lt__(self, other):
+                return "lt"
+
+        C = make_class("C", ["x", "y"])
+
+        assert "lt" == ((1, V()) < (1, V())) == (C(1, V()) < C(1, V()))
+
+    def test_no_attributes(self):
+        """
+        Instances without attributes to order by are all equal.
+        """
+        C = make_class("C", {"a": attr.ib(order=False)})
+
+        assert not C(1) < C(2)
+        assert C(1) <= C(2)
+        assert not C(1) > C(2)
+        assert C(1) >= C(2)
+
 
 class TestDetermineEqOrder(object):
     def test_default(self):
@@ -1580,3 +1868,259 @@ class TestDetermineEqOrder(object):
             "2021-06-01.  Please use `eq` and `order` instead."
             == w.message.args[0]
         )
+
+
+@pytest.fixture(name="code_cache_dir")
+def _code_cache_dir(tmpdir, monkeypatch):
+    """
+    Enable the on-disk code cache for the duration of a test and make sure
+    nothing is served from memory.
+    """
+    monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+    path = str(tmpdir.join("cache"))
+    _config.set_code_cache_dir(path)
+    yield path
+    _config.set_code_cache_dir(None)
+
+
+def _forbid_compile(monkeypatch):
+    """
+    Make sure no generated method gets compiled.
+    """
+
+    def compile(*args, **kw):
+        raise AssertionError("compile() called despite cache.")
+
+    monkeypatch.setattr(_make, "compile", compile, raising=False)
+
+
+class TestMakeMethod(object):
+    """
+    Tests for `_make_method`.
+    """
+
+    def test_creates_method(self):
+        """
+        Returns the function defined in the script and adds a linecache entry
+        for it.
+        """
+        script = "def f(x):\n    return x + y\n"
+
+        f = _make_method("f", script, "<attrs test make_method>", {"y": 1})
+
+        assert 3 == f(2)
+        assert script.splitlines(True) == linecache.getlines(
+            "<attrs test make_method>"
+        )
+
+
+class TestGenerateUniqueFilename(object):
+    """
+    Tests for `_generate_unique_filename`.
+    """
+
+    def test_counts_per_name(self, monkeypatch):
+        """
+        Classes with the same qualified name get a running counter, others
+        don't interfere.
+        """
+        monkeypatch.setattr(_make, "_unique_filename_counts", {})
+
+        class C(object):
+            pass
+
+        class D(object):
+            pass
+
+        c = "tests.test_make." + getattr(C, "__qualname__", "C")
+        d = "tests.test_make." + getattr(D, "__qualname__", "D")
+
+        assert [
+            "<attrs generated init " + c + ">",
+            "<attrs generated init " + c + "-2>",
+            "<attrs generated eq " + c + ">",
+            "<attrs generated init " + d + ">",
+            "<attrs generated init " + c + "-3>",
+        ] == [
+            _generate_unique_filename(C, "init"),
+            _generate_unique_filename(C, "init"),
+            _generate_unique_filename(C, "eq"),
+            _generate_unique_filename(D, "init"),
+            _generate_unique_filename(C, "init"),
+        ]
+
+    def test_threads(self, monkeypatch):
+        """
+        File names are unique across threads.
+        """
+        monkeypatch.setattr(_make, "_unique_filename_counts", {})
+
+        class C(object):
+            pass
+
+        names = []
+
+        def generate():
+            for _ in range(100):
+                names.append(_generate_unique_filename(C, "init"))
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert 400 == len(set(names))
+
+
+class TestPopulateLinecache(object):
+    """
+    Tests for turning off the linecache entries of generated methods.
+    """
+
+    def test_disabled(self):
+        """
+        If disabled, generated methods work but have no linecache entries.
+        """
+        _config.set_populate_linecache(False)
+        try:
+            C = make_class("C", ["a"])
+        finally:
+            _config.set_populate_linecache(True)
+
+        assert C(1) == C(1)
+        assert C.__init__.__code__.co_filename not in linecache.cache
+
+
+class TestSharedCode(object):
+    """
+    Tests for sharing byte code between classes of the same shape.
+    """
+
+    def test_compiles_once(self, monkeypatch):
+        """
+        Classes of the same shape share the byte code of their methods but
+        use their own converters, validators, and defaults.
+        """
+        monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+
+        def make(default):
+            return make_class(
+                "C",
+                {
+                    "a": attr.ib(converter=str),
+                    "b": attr.ib(
+                        default=default, validator=attr.validators.in_([1, 2])
+                    ),
+                },
+                hash=True,
+            )
+
+        C1 = make(1)
+        _forbid_compile(monkeypatch)
+        C2 = make(2)
+
+        assert C1.__init__.__code__.co_code == C2.__init__.__code__.co_code
+        assert C1(1) == C1(1)
+        assert hash(C1(1)) == hash(C1(1))
+        assert C2(1) == C2(1, 2)
+        assert 1 == C1(1).b
+        assert 2 == C2(1).b
+        assert "1" == C2(1).a
+        with pytest.raises(ValueError):
+            C2(1, 3)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="Needs CodeType.replace()."
+    )
+    def test_own_filename(self):
+        """
+        Shared byte code reports the file name of its own class such that
+        tracebacks and debuggers point to the right linecache entry.
+        """
+        C1 = make_class("C", ["a"])
+        C2 = make_class("C", ["a"])
+
+        fn1 = C1.__init__.__code__.co_filename
+        fn2 = C2.__init__.__code__.co_filename
+
+        assert fn1 != fn2
+        assert linecache.getlines(fn1) == linecache.getlines(fn2)
+
+    def test_bounded(self, monkeypatch):
+        """
+        The cache holds at most `_code_cache_size` code objects and drops
+        the least recently used ones first.
+        """
+        monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+        monkeypatch.setattr(_make, "_code_cache_size", 2)
+
+        _compile_script("a = 1\n", "<a>")
+        _compile_script("b = 1\n", "<b>")
+        _compile_script("a = 1\n", "<a>")
+        _compile_script("c = 1\n", "<c>")
+
+        assert ["a = 1\n", "c = 1\n"] == list(_make._code_cache)
+
+
+class TestCodeCache(object):
+    """
+    Tests for the on-disk cache of generated byte code.
+    """
+
+    def test_writes_cache(self, code_cache_dir):
+        """
+        Generating methods populates the cache directory.
+        """
+        make_class("C", ["a", "b"], hash=True)
+
+        assert os.listdir(code_cache_dir)
+
+    def test_uses_cache(self, code_cache_dir, monkeypatch):
+        """
+        If the byte code is cached, it's used instead of compiling and the
+        methods still work and have linecache entries.
+        """
+        make_class("CachedC", ["a", "b"], hash=True)
+        # Simulate a fresh interpreter that hasn't generated any methods yet.
+        monkeypatch.setattr(_make, "_unique_filename_counts", {})
+        monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+        _forbid_compile(monkeypatch)
+
+        C = make_class("CachedC", ["a", "b"], hash=True)
+
+        i = C(1, 2)
+
+        assert "CachedC(a=1, b=2)" == repr(i)
+        assert C(1, 2) == i
+        assert hash(C(1, 2)) == hash(i)
+        assert linecache.getlines(C.__init__.__code__.co_filename)
+
+    def test_ignores_corrupt_cache(self, code_cache_dir, monkeypatch):
+        """
+        Unusable cache files are ignored and overwritten.
+        """
+        make_class("C", ["a"])
+        monkeypatch.setattr(_make, "_unique_filename_counts", {})
+        monkeypatch.setattr(_make, "_code_cache", ordered_dict())
+        for name in os.listdir(code_cache_dir):
+            with open(os.path.join(code_cache_dir, name), "wb") as f:
+                f.write(b"not marshal data")
+
+        C = make_class("C", ["a"])
+
+        assert C(1) == C(1)
+
+    def test_unwritable_cache(self, tmpdir):
+        """
+        If the cache directory can't be created, classes are built anyway.
+        """
+        path = tmpdir.join("file")
+        path.write("")
+        _config.set_code_cache_dir(str(path.join("cache")))
+        try:
+            C = make_class("C", ["a"])
+        finally:
+            _config.set_code_cache_dir(None)
+
+        assert C(1) == C(1)
@@ -1,9 +1,11 @@
 import re
 
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import attr
 
+from attr import codegen
+
 
 # Typing via "type" Argument ---
 
@@ -183,3 +185,106 @@ class WithCustomRepr:
 class OrderFlags:
     a = attr.ib(eq=False, order=False)
     b = attr.ib(eq=True, order=True)
+
+
+# Caching the byte code of generated methods
+attr.set_code_cache_dir("/tmp/attrs")
+cache_dir: Optional[str] = attr.get_code_cache_dir()
+attr.set_code_cache_dir(None)
+
+
+# Generating methods on first use
+@attr.s(lazy=True)
+class Lazy:
+    a: int = attr.ib()
+
+
+Lazy(1) == Lazy(2)
+
+
+# Observing class builds
+def print_timings(cls: type, timings: List[Tuple[str, float]]) -> None:
+    for step, seconds in timings:
+        print(cls.__name__, step, seconds)
+
+
+attr.set_build_observer(print_timings)
+observer = attr.get_build_observer()
+attr.set_build_observer(None)
+
+
+# Not keeping the source code of generated methods around
+attr.set_populate_linecache(False)
+populate: bool = attr.get_populate_linecache()
+attr.set_populate_linecache(True)
+
+
+# Compiling generated methods ahead of time
+source: str = codegen.generate(["mypkg.models"])
+codegen.register([])
+codegen.main(["mypkg.models", "-o", "mypkg/_attrs_models.py"])
+
+
+# Sorting instances
+@attr.s(auto_attribs=True)
+class Sortable:
+    a: int
+    b: str = attr.ib(order=False)
+
+
+sortables = [Sortable(2, "x"), Sortable(1, "y")]
+by_key: List[Sortable] = sorted(sortables, key=attr.sort_key(Sortable))
+by_attrs: List[Sortable] = attr.sort_instances(sortables, reverse=True)
+
+
+# Computing hash codes eagerly
+@attr.s(frozen=True, cache_hash=True, eager_hash=True)
+class EagerHash:
+    a: int = attr.ib()
+
+
+hash(EagerHash(1))
+
+
+# Interning instances
+@attr.s(frozen=True, intern=True)
+class Interned:
+    a: int = attr.ib()
+
+
+Interned(1) is Interned(1)
+
+
+# Storing instances column by column
+@attr.s(auto_attribs=True)
+class Row:
+    x: int
+    y: float
+
+
+table: attr.Table[Row] = attr.column_store(Row, [Row(1, 2.0)])
+table.append(Row(3, 4.0))
+row_count: int = len(table)
+first: Row = table.instance(0)
+
+# Exporting instances column by column
+columns: Dict[str, List[Any]] = attr.to_columns([Row(1, 2.0)], Row)
+
+# Getting the attribute values as a tuple
+get_row = attr.tuple_getter(Row)
+row_values: Tuple[Any, ...] = get_row(Row(1, 2.0))
+
+# Converting shared sub-objects only once
+shared_dict: Dict[str, Any] = attr.asdict(Row(1, 2.0), memo=True)
+shared_tuple: Tuple[Any, ...] = attr.astuple(Row(1, 2.0), memo=True)
+
+# Streaming instances as JSON text
+json_chunks: Iterator[str] = attr.iter_json(Row(1, 2.0))
+json_text: str = "".join(json_chunks)
+
+# Encoding instances as JSON with a generated function
+encode_row = attr.json_encoder(Row)
+encoded_row: str = encode_row(Row(1, 2.0))
+
+# Creating instances from dicts
+from_dict_row: Row = attr.from_dict(Row, {"x": 1, "y": 2.0})